@@ -3,14 +3,16 @@
 Main executable entry point for the Mise Task Tools MCP Server
 """
 
+import os
 import sys
-import asyncio
 from pathlib import Path
 
-# Add the package to Python path for development
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the package to Python path for development checkouts only; installed
+# packages are already importable and don't need the extra sys.path entry
+if os.environ.get("WISE_MISE_DEV"):
+    sys.path.insert(0, str(Path(__file__).parent))
 
-from wise_mise_mcp.server import main
+from wise_mise_mcp.__main__ import main
 
 if __name__ == "__main__":
     try:
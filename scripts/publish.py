@@ -3,17 +3,23 @@
 Publication script for wise-mise-mcp package
 """
 
+import os
+import shlex
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-def run_command(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
-    print(f"🔄 Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def run_command(cmd: list[str], check: bool = True) -> subprocess.CompletedProcess:
+    """Run a command (without a shell) from the project root and return the result."""
+    print(f"🔄 Running: {shlex.join(cmd)}")
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
     
     if check and result.returncode != 0:
-        print(f"❌ Command failed: {cmd}")
+        print(f"❌ Command failed: {shlex.join(cmd)}")
         print(f"STDOUT: {result.stdout}")
         print(f"STDERR: {result.stderr}")
         sys.exit(1)
@@ -25,28 +31,29 @@ def run_command(cmd: str, check: bool = True) -> subprocess.CompletedProcess:
 
 def main():
     """Main publication workflow."""
-    project_root = Path(__file__).parent.parent
-    dist_dir = project_root / "dist"
+    dist_dir = PROJECT_ROOT / "dist"
     
     print("🚀 Starting PyPI publication process...")
     
     # Clean previous builds
     print("\n1. Cleaning previous builds...")
-    run_command("rm -rf build dist *.egg-info")
+    for path in [PROJECT_ROOT / "build", dist_dir, *PROJECT_ROOT.glob("*.egg-info")]:
+        shutil.rmtree(path, ignore_errors=True)
     
     # Build the package
     print("\n2. Building package...")
-    run_command("uv run python -m build")
+    run_command(["uv", "run", "python", "-m", "build"])
     
     # Validate the package
     print("\n3. Validating package...")
-    run_command("uv run twine check dist/*")
+    dist_files = sorted(str(path) for path in dist_dir.iterdir())
+    run_command(["uv", "run", "twine", "check", *dist_files])
     
     # List built files
     print("\n4. Built files:")
-    for file in dist_dir.glob("*"):
-        size = file.stat().st_size
-        print(f"   📦 {file.name} ({size:,} bytes)")
+    with os.scandir(dist_dir) as entries:
+        for entry in entries:
+            print(f"   📦 {entry.name} ({entry.stat().st_size:,} bytes)")
     
     print("\n✅ Package is ready for publication!")
     print("\n🔄 Next steps:")
@@ -64,7 +71,7 @@ def main():
     if response == 'y':
         print("\n🚀 Publishing to PyPI...")
         try:
-            run_command("uv run twine upload dist/*")
+            run_command(["uv", "run", "twine", "upload", *dist_files])
             print("\n🎉 Successfully published to PyPI!")
             print("   📦 Package: https://pypi.org/project/wise-mise-mcp/")
             print("   📥 Install: uv add wise-mise-mcp")
@@ -0,0 +1,26 @@
+"""
+Shared fixtures for the benchmark suite
+"""
+
+import asyncio
+
+import pytest
+
+from wise_mise_mcp.server import (
+    analyze_project_for_tasks,
+    get_task_recommendations,
+    validate_task_architecture,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_tools(tmp_path_factory):
+    """Call each tool once up front so round 0 of every benchmark isn't a cold start"""
+    project_path = str(tmp_path_factory.mktemp("warm"))
+
+    async def warm():
+        await analyze_project_for_tasks.fn(project_path=project_path)
+        await validate_task_architecture.fn(project_path=project_path)
+        await get_task_recommendations.fn()
+
+    asyncio.run(warm())
@@ -11,84 +11,42 @@ Tests the performance characteristics of the MCP server including:
 import pytest
 import asyncio
 import time
-import psutil
 import gc
-from pathlib import Path
+import tracemalloc
 from typing import Dict, List, Any
 from unittest.mock import Mock, AsyncMock
 
-import pytest_benchmark
 from wise_mise_mcp.server import (
     analyze_project_for_tasks,
     trace_task_chain,
     create_task,
     validate_task_architecture,
     get_task_recommendations,
-    AnalyzeProjectRequest,
-    TraceTaskChainRequest,
-    CreateTaskRequest,
-    ValidateArchitectureRequest,
 )
 
+try:
+    import uvloop
+except ImportError:  # optional; benchmarks fall back to the stdlib loop
+    uvloop = None
 
-class TestMCPServerPerformance:
-    """Performance benchmarks for MCP server operations"""
 
-    @pytest.mark.benchmark(group="analyze_project")
-    def test_analyze_small_project_performance(self, benchmark, temp_project_dir):
-        """Benchmark project analysis for small projects (< 50 files)"""
-        
-        def setup_small_project():
-            # Create a small project structure
-            for i in range(20):
-                (temp_project_dir / f"file_{i}.py").write_text(f"# File {i}")
-            (temp_project_dir / "package.json").write_text('{"name": "test"}')
-            return AnalyzeProjectRequest(project_path=str(temp_project_dir))
-        
-        async def analyze_project():
-            request = setup_small_project()
-            return await analyze_project_for_tasks.fn(project_path=request.project_path)
-        
-        result = benchmark(lambda: asyncio.run(analyze_project()))
-        assert "error" not in result
-        # Verify we have expected structure fields
-        assert "project_structure" in result
-        assert "package_managers" in result["project_structure"]
-        assert len(result["existing_tasks"]) >= 0
+# Documented performance expectations; recorded with the regression baseline
+# so benchmark comparisons can check results against them
+THRESHOLDS = {
+    "small_project_analysis_ms": 100,    # < 100ms for small projects
+    "large_project_analysis_ms": 5000,   # < 5s for large projects
+    "task_chain_trace_ms": 50,           # < 50ms for task chain tracing
+    "memory_usage_mb": 50,               # < 50MB memory usage
+    "concurrent_operations": 10,         # Support 10+ concurrent operations
+}
 
-    @pytest.mark.benchmark(group="analyze_project")
-    @pytest.mark.slow
-    def test_analyze_large_project_performance(self, benchmark, complex_project_structure):
-        """Benchmark project analysis for large projects (1000+ files)"""
-        
-        def setup_large_project():
-            # Create a large project structure
-            for i in range(500):
-                (complex_project_structure / "frontend" / f"component_{i}.tsx").write_text(
-                    f"export const Component{i} = () => <div>Component {i}</div>;"
-                )
-                (complex_project_structure / "backend" / f"model_{i}.py").write_text(
-                    f"class Model{i}:\n    pass"
-                )
-            return AnalyzeProjectRequest(project_path=str(complex_project_structure))
-        
-        async def analyze_large_project():
-            request = setup_large_project()
-            return await analyze_project_for_tasks.fn(project_path=request.project_path)
-        
-        result = benchmark(lambda: asyncio.run(analyze_large_project()))
-        assert "error" not in result
-        # Verify we have a complex project structure
-        assert "project_structure" in result
-        assert len(result["existing_tasks"]) > 0
+_TSX_TEMPLATE = b"export const Component%d = () => <div>Component %d</div>;"
+_PY_TEMPLATE = b"class Model%d:\n    pass"
 
-    @pytest.mark.benchmark(group="task_operations")
-    def test_task_chain_tracing_performance(self, benchmark, temp_project_dir):
-        """Benchmark task chain analysis performance"""
-        
-        def setup_complex_task_chain():
-            # Create .mise.toml with complex dependencies
-            mise_config = """
+BASELINE_PACKAGE_JSON = b'{"name": "test", "scripts": {"build": "webpack", "test": "jest"}}'
+
+# Diamond-shaped chain: deploy -> {e2e, security_scan} -> ... -> test
+COMPLEX_TASK_CHAIN_CONFIG = """
 [tasks.compile]
 run = "gcc -c src/*.c"
 sources = ["src/**/*.c", "include/**/*.h"]
@@ -127,69 +85,146 @@ depends = ["e2e", "security_scan"]
 run = "bandit -r src/"
 depends = ["test"]
 """
-            (temp_project_dir / ".mise.toml").write_text(mise_config.strip())
-            return TraceTaskChainRequest(
-                project_path=str(temp_project_dir),
-                task_name="deploy"
-            )
+
+
+@pytest.fixture(scope="module")
+def benchmark_loop():
+    """One event loop shared by every benchmark round in this module"""
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def large_project_tree(tmp_path_factory):
+    """Build a 1000+ file project once per module, outside any timed region"""
+    project_path = tmp_path_factory.mktemp("large_project")
+    (project_path / "frontend").mkdir()
+    (project_path / "backend").mkdir()
+    (project_path / "package.json").write_bytes(b'{"name": "large-project"}')
+    (project_path / ".mise.toml").write_text(
+        '[tasks.build]\nrun = "npm run build"\n\n'
+        '[tasks.test]\nrun = "npm test"\ndepends = ["build"]\n'
+    )
+    for i in range(500):
+        (project_path / "frontend" / f"component_{i}.tsx").write_bytes(_TSX_TEMPLATE % (i, i))
+        (project_path / "backend" / f"model_{i}.py").write_bytes(_PY_TEMPLATE % i)
+    return project_path
+
+
+class TestMCPServerPerformance:
+    """Performance benchmarks for MCP server operations"""
+
+    @pytest.mark.benchmark(group="analyze_project")
+    def test_analyze_small_project_performance(self, benchmark, benchmark_loop, temp_project_dir):
+        """Benchmark project analysis for small projects (< 50 files)"""
+        
+        # Create a small project structure
+        for i in range(20):
+            (temp_project_dir / f"file_{i}.py").write_bytes(b"# File %d" % i)
+        (temp_project_dir / "package.json").write_bytes(b'{"name": "test"}')
+        project_path = str(temp_project_dir)
+        
+        async def analyze_project():
+            return await analyze_project_for_tasks.fn(project_path=project_path)
+        
+        result = benchmark(lambda: benchmark_loop.run_until_complete(analyze_project()))
+        assert "error" not in result
+        # Verify we have expected structure fields
+        assert "project_structure" in result
+        assert "package_managers" in result["project_structure"]
+        assert len(result["existing_tasks"]) >= 0
+
+    @pytest.mark.benchmark(group="analyze_project")
+    @pytest.mark.slow
+    def test_analyze_large_project_performance(self, benchmark, benchmark_loop, large_project_tree):
+        """Benchmark project analysis for large projects (1000+ files)"""
+        project_path = str(large_project_tree)
+        
+        async def analyze_large_project():
+            return await analyze_project_for_tasks.fn(project_path=project_path)
+        
+        result = benchmark(lambda: benchmark_loop.run_until_complete(analyze_large_project()))
+        assert "error" not in result
+        # Verify we have a complex project structure
+        assert "project_structure" in result
+        assert len(result["existing_tasks"]) > 0
+
+    @pytest.mark.benchmark(group="task_operations")
+    def test_task_chain_tracing_performance(self, benchmark, benchmark_loop, temp_project_dir):
+        """Benchmark task chain analysis performance"""
+        
+        # Create .mise.toml with complex dependencies
+        (temp_project_dir / ".mise.toml").write_text(COMPLEX_TASK_CHAIN_CONFIG.strip())
+        project_path = str(temp_project_dir)
         
         async def trace_complex_chain():
-            request = setup_complex_task_chain()
-            return await trace_task_chain.fn(
-                project_path=request.project_path,
-                task_name=request.task_name
-            )
+            return await trace_task_chain.fn(project_path=project_path, task_name="deploy")
         
-        result = benchmark(lambda: asyncio.run(trace_complex_chain()))
+        result = benchmark(lambda: benchmark_loop.run_until_complete(trace_complex_chain()))
         assert "error" not in result
         # Should have traced the complex dependency chain
         assert "execution_chain" in result
         assert len(result["execution_chain"]) >= 1
 
     @pytest.mark.benchmark(group="task_operations")
-    def test_concurrent_task_creation_performance(self, benchmark, temp_project_dir):
+    def test_concurrent_task_creation_performance(self, benchmark, benchmark_loop, temp_project_dir):
         """Benchmark concurrent task creation operations"""
+        config_path = temp_project_dir / ".mise.toml"
+        original_config = config_path.read_bytes()
+        
+        def reset_config():
+            # Every round creates the same names, so start each from the original tasks
+            config_path.write_bytes(original_config)
         
         async def create_multiple_tasks():
-            tasks = []
-            for i in range(10):
-                task = create_task.fn(
-                    project_path=str(temp_project_dir),
-                    task_description=f"Test task number {i}",
-                    suggested_name=f"test_task_{i}"
-                )
-                tasks.append(task)
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(create_task.fn(
+                        project_path=str(temp_project_dir),
+                        task_description=f"Test task number {i}",
+                        suggested_name=f"test_task_{i}"
+                    ))
+                    for i in range(10)
+                ]
             
-            return await asyncio.gather(*tasks)
+            return [task.result() for task in tasks]
         
-        results = benchmark(lambda: asyncio.run(create_multiple_tasks()))
-        assert len(results) == 10
-        for result in results:
-            assert "error" not in result
+        # pedantic only hands back the last round; keep every round's results
+        rounds = []
+        benchmark.pedantic(
+            lambda: rounds.append(benchmark_loop.run_until_complete(create_multiple_tasks())),
+            setup=reset_config,
+            rounds=5,
+        )
+        assert rounds
+        for results in rounds:
+            assert len(results) == 10
+            for result in results:
+                assert "error" not in result
+                assert result["result"]["success"] is True
 
     @pytest.mark.benchmark(group="memory_usage")
-    def test_memory_usage_during_large_analysis(self, benchmark, complex_project_structure):
+    def test_memory_usage_during_large_analysis(self, benchmark, benchmark_loop, complex_project_structure):
         """Benchmark memory usage during large project analysis"""
         
+        project_path = str(complex_project_structure)
+        
         def monitor_memory_usage():
-            process = psutil.Process()
-            memory_before = process.memory_info().rss
-            
             async def analyze_with_memory_monitoring():
-                request = AnalyzeProjectRequest(project_path=str(complex_project_structure))
                 gc.collect()  # Clean up before measurement
+                tracemalloc.reset_peak()
                 
-                memory_start = process.memory_info().rss
-                result = await analyze_project_for_tasks.fn(project_path=request.project_path)
-                memory_peak = process.memory_info().rss
+                memory_start, _ = tracemalloc.get_traced_memory()
+                result = await analyze_project_for_tasks.fn(project_path=project_path)
+                _, memory_peak = tracemalloc.get_traced_memory()
                 
-                gc.collect()  # Clean up after analysis
-                memory_end = process.memory_info().rss
+                gc.collect()  # Drop cyclic garbage so only retained objects count as leaked
+                memory_end, _ = tracemalloc.get_traced_memory()
                 
                 return {
                     "result": result,
                     "memory_stats": {
-                        "before_mb": memory_before / 1024 / 1024,
                         "start_mb": memory_start / 1024 / 1024,
                         "peak_mb": memory_peak / 1024 / 1024,
                         "end_mb": memory_end / 1024 / 1024,
@@ -197,9 +232,15 @@ depends = ["test"]
                     }
                 }
             
-            return asyncio.run(analyze_with_memory_monitoring())
+            return benchmark_loop.run_until_complete(analyze_with_memory_monitoring())
         
-        result = benchmark(monitor_memory_usage)
+        # Python-heap accounting kept inline by the allocator, instead of a
+        # /proc/self/status parse per RSS probe
+        tracemalloc.start()
+        try:
+            result = benchmark(monitor_memory_usage)
+        finally:
+            tracemalloc.stop()
         
         # Verify the analysis succeeded
         assert "error" not in result["result"]
@@ -215,83 +256,82 @@ depends = ["test"]
         assert memory_leaked < 10  # Less than 10MB leaked
 
     @pytest.mark.benchmark(group="task_recommendations")
-    def test_task_recommendations_performance(self, benchmark, complex_project_structure):
+    def test_task_recommendations_performance(self, benchmark, benchmark_loop, complex_project_structure):
         """Benchmark task recommendation generation performance"""
         
         async def generate_recommendations():
             return await get_task_recommendations.fn()
         
-        result = benchmark(lambda: asyncio.run(generate_recommendations()))
+        result = benchmark(lambda: benchmark_loop.run_until_complete(generate_recommendations()))
         assert "error" not in result
         assert "best_practices" in result
 
     @pytest.mark.benchmark(group="architecture_validation")
-    def test_architecture_validation_performance(self, benchmark, temp_project_dir):
+    def test_architecture_validation_performance(self, benchmark, benchmark_loop, temp_project_dir):
         """Benchmark architecture validation performance"""
         
-        def setup_validation_request():
-            # Create complex task architecture for validation in .mise.toml
-            mise_config = "[tools]\nnode = '20'\n\n"
-            for i in range(10):  # Reduced from 50 for faster testing
-                depends_clause = f'depends = ["task_{i-1}"]' if i > 0 else ""
-                mise_config += f'[tasks."task_{i}"]\nrun = "echo Task {i}"\n{depends_clause}\n\n'
-            
-            (temp_project_dir / ".mise.toml").write_text(mise_config)
-            return temp_project_dir
+        # Create complex task architecture for validation in .mise.toml
+        parts = ["[tools]\nnode = '20'\n"]
+        for i in range(10):  # Reduced from 50 for faster testing
+            depends_clause = f'depends = ["task_{i-1}"]' if i > 0 else ""
+            parts.append(f'[tasks."task_{i}"]\nrun = "echo Task {i}"\n{depends_clause}\n')
+        
+        (temp_project_dir / ".mise.toml").write_text("\n".join(parts))
         
         def run_validation():
-            request = setup_validation_request()
-            
             async def validate():
-                return await validate_task_architecture.fn(project_path=str(request))
+                return await validate_task_architecture.fn(project_path=str(temp_project_dir))
             
-            return asyncio.run(validate())
+            return benchmark_loop.run_until_complete(validate())
         
         result = benchmark(run_validation)
         assert "error" not in result
 
     @pytest.mark.benchmark(group="stress_test")
     @pytest.mark.slow
-    def test_sustained_load_performance(self, benchmark):
+    def test_sustained_load_performance(self, benchmark, benchmark_loop, tmp_path):
         """Test server performance under sustained load"""
+        project_path = tmp_path
+        
+        # Create test files
+        for i in range(100):
+            (project_path / f"test_{i}.py").write_bytes(b"# Test file %d" % i)
+        
+        def reset_config():
+            # Every round starts from a project without the tasks created before
+            (project_path / ".mise.toml").unlink(missing_ok=True)
         
         async def sustained_operations():
-            # Create temporary directory for testing
-            import tempfile
-            with tempfile.TemporaryDirectory() as temp_dir:
-                project_path = Path(temp_dir)
-                
-                # Create test files
-                for i in range(100):
-                    (project_path / f"test_{i}.py").write_text(f"# Test file {i}")
-                
-                # Run many operations in parallel
-                operations = []
-                
-                # Mix different types of operations
-                for i in range(20):
-                    # Analysis operations
-                    analysis_request = AnalyzeProjectRequest(project_path=str(project_path))
-                    operations.append(analyze_project_for_tasks.fn(project_path=analysis_request.project_path))
-                    
-                    # Task creation operations
-                    operations.append(create_task.fn(
-                        project_path=str(project_path),
-                        task_description=f"Load test task {i}"
-                    ))
-                
-                # Execute all operations concurrently
-                results = await asyncio.gather(*operations, return_exceptions=True)
+            # Run many operations in parallel
+            operations = []
+            
+            # Mix different types of operations
+            for i in range(20):
+                # Analysis operations
+                operations.append(analyze_project_for_tasks.fn(project_path=str(project_path)))
                 
-                # Count successful operations
-                successful = sum(1 for r in results if not isinstance(r, Exception))
-                return {
-                    "total_operations": len(operations),
-                    "successful_operations": successful,
-                    "error_rate": (len(operations) - successful) / len(operations)
-                }
+                # Task creation operations
+                operations.append(create_task.fn(
+                    project_path=str(project_path),
+                    task_description=f"Load test task {i}"
+                ))
+            
+            # Execute all operations concurrently
+            results = await asyncio.gather(*operations, return_exceptions=True)
+            
+            # Count successful operations
+            successful = sum(1 for r in results if not isinstance(r, Exception))
+            return {
+                "total_operations": len(operations),
+                "successful_operations": successful,
+                "error_rate": (len(operations) - successful) / len(operations)
+            }
         
-        result = benchmark(lambda: asyncio.run(sustained_operations()))
+        result = benchmark.pedantic(
+            lambda: benchmark_loop.run_until_complete(sustained_operations()),
+            setup=reset_config,
+            rounds=5,
+        )
         
         # At least 80% of operations should succeed under load
         assert result["error_rate"] < 0.2
@@ -302,42 +342,26 @@ class TestPerformanceRegression:
     """Tests to detect performance regressions"""
     
     @pytest.mark.benchmark(group="regression")
-    def test_baseline_analysis_performance(self, benchmark, temp_project_dir):
+    def test_baseline_analysis_performance(self, benchmark, benchmark_loop, temp_project_dir):
         """Baseline performance test for regression detection"""
         
         # Create standard test project
-        (temp_project_dir / "package.json").write_text(
-            '{"name": "test", "scripts": {"build": "webpack", "test": "jest"}}'
-        )
+        (temp_project_dir / "package.json").write_bytes(BASELINE_PACKAGE_JSON)
         for i in range(10):
-            (temp_project_dir / f"src/component_{i}.js").write_text(
-                f"export const Component{i} = () => 'Component {i}';"
+            (temp_project_dir / f"src/component_{i}.js").write_bytes(
+                b"export const Component%d = () => 'Component %d';" % (i, i)
             )
         
         async def baseline_analysis():
-            request = AnalyzeProjectRequest(project_path=str(temp_project_dir))
-            return await analyze_project_for_tasks.fn(project_path=request.project_path)
+            project_path = str(temp_project_dir)
+            return await analyze_project_for_tasks.fn(project_path=project_path)
         
-        result = benchmark(lambda: asyncio.run(baseline_analysis()))
+        result = benchmark(lambda: benchmark_loop.run_until_complete(baseline_analysis()))
         assert "error" not in result
         
         # Store baseline metrics for comparison
         benchmark.extra_info = {
             "package_managers": len(result["project_structure"].get("package_managers", [])),
-            "task_count": len(result.get("recommended_tasks", []))
+            "task_count": len(result.get("recommended_tasks", [])),
+            "thresholds": THRESHOLDS,
         }
-
-    def test_performance_thresholds(self):
-        """Verify performance meets minimum thresholds"""
-        # These would typically be configured based on benchmarking results
-        THRESHOLDS = {
-            "small_project_analysis_ms": 100,    # < 100ms for small projects
-            "large_project_analysis_ms": 5000,   # < 5s for large projects  
-            "task_chain_trace_ms": 50,           # < 50ms for task chain tracing
-            "memory_usage_mb": 50,               # < 50MB memory usage
-            "concurrent_operations": 10,         # Support 10+ concurrent operations
-        }
-        
-        # This test serves as documentation of performance expectations
-        # Actual threshold checking would be done by the benchmark comparison
-        assert all(threshold > 0 for threshold in THRESHOLDS.values())
\ No newline at end of file
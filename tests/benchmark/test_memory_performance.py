@@ -21,8 +21,6 @@ import time
 from wise_mise_mcp.server import (
     analyze_project_for_tasks,
     create_task,
-    AnalyzeProjectRequest,
-    CreateTaskRequest
 )
 
 
@@ -88,8 +86,7 @@ class TestMemoryPerformance:
         def memory_test():
             with MemoryProfiler("small_project") as profiler:
                 async def analyze():
-                    request = AnalyzeProjectRequest(project_path=str(temp_project_dir))
-                    return await analyze_project_for_tasks.fn(project_path=request.project_path)
+                    return await analyze_project_for_tasks.fn(project_path=str(temp_project_dir))
                 
                 result = asyncio.run(analyze())
                 
@@ -130,8 +127,7 @@ class TestMemoryPerformance:
         def memory_test_large():
             with MemoryProfiler("large_project") as profiler:
                 async def analyze_large():
-                    request = AnalyzeProjectRequest(project_path=str(complex_project_structure))
-                    return await analyze_project_for_tasks.fn(project_path=request.project_path)
+                    return await analyze_project_for_tasks.fn(project_path=str(complex_project_structure))
                 
                 result = asyncio.run(analyze_large())
                 
@@ -179,23 +175,15 @@ depends = ["test"]
                 with MemoryProfiler(f"iteration_{iteration}") as profiler:
                     async def perform_operations():
                         # Mix of different operations
-                        request1 = AnalyzeProjectRequest(project_path=str(temp_project_dir))
-                        result1 = await analyze_project_for_tasks.fn(project_path=request1.project_path)
+                        result1 = await analyze_project_for_tasks.fn(project_path=str(temp_project_dir))
                         
-                        request2 = CreateTaskRequest(
+                        result2 = await create_task.fn(
                             project_path=str(temp_project_dir),
                             task_description=f"Leak test iteration {iteration}",
                             suggested_name=f"leak_test_{iteration}",
                             force_complexity="simple",
                             domain_hint="build"
                         )
-                        result2 = await create_task.fn(
-                            project_path=request2.project_path,
-                            task_description=request2.task_description,
-                            suggested_name=request2.suggested_name,
-                            force_complexity=request2.force_complexity,
-                            domain_hint=request2.domain_hint
-                        )
                         
                         return result1, result2
                     
@@ -249,8 +237,7 @@ depends = ["test"]
             while (time.time() - start_time < target_duration and iteration < max_iterations):
                 with MemoryProfiler(f"long_run_{iteration}") as profiler:
                     async def operation():
-                        request = AnalyzeProjectRequest(project_path=str(temp_project_dir))
-                        return await analyze_project_for_tasks.fn(project_path=request.project_path)
+                        return await analyze_project_for_tasks.fn(project_path=str(temp_project_dir))
                     
                     result = asyncio.run(operation())
                     
@@ -307,8 +294,7 @@ depends = ["test"]
                     tasks = []
                     
                     for i in range(10):  # Reduced from 20 to 10 concurrent operations
-                        request = AnalyzeProjectRequest(project_path=str(temp_project_dir))
-                        task = analyze_project_for_tasks.fn(project_path=request.project_path)
+                        task = analyze_project_for_tasks.fn(project_path=str(temp_project_dir))
                         tasks.append(task)
                     
                     # Wait for all operations to complete
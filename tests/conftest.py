@@ -3,10 +3,10 @@ pytest configuration and shared fixtures for wise-mise-mcp tests
 """
 
 import pytest
+import shutil
 import tempfile
 import json
 from pathlib import Path
-from typing import Dict, Any
 from unittest.mock import Mock, AsyncMock
 
 from wise_mise_mcp.models import (
@@ -20,39 +20,38 @@ from wise_mise_mcp.analyzer import TaskAnalyzer
 from wise_mise_mcp.manager import TaskManager
 
 
-@pytest.fixture
-def temp_project_dir():
-    """Create a temporary project directory for testing"""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        project_path = Path(temp_dir)
-        
-        # Create basic project structure
-        (project_path / "src").mkdir()
-        (project_path / "tests").mkdir()
-        (project_path / "docs").mkdir()
-        
-        # Create package.json for JavaScript project
-        package_json = {
-            "name": "test-project",
-            "version": "1.0.0",
-            "scripts": {
-                "build": "webpack build",
-                "test": "jest",
-                "dev": "webpack serve",
-                "lint": "eslint ."
-            },
-            "devDependencies": {
-                "jest": "^29.0.0",
-                "eslint": "^8.0.0",
-                "webpack": "^5.0.0"
-            }
+@pytest.fixture(scope="session")
+def _template_project_dir(tmp_path_factory):
+    """Build the basic project tree once; temp_project_dir copies it per test"""
+    project_path = tmp_path_factory.mktemp("template_project")
+    
+    # Create basic project structure
+    (project_path / "src").mkdir()
+    (project_path / "tests").mkdir()
+    (project_path / "docs").mkdir()
+    
+    # Create package.json for JavaScript project
+    package_json = {
+        "name": "test-project",
+        "version": "1.0.0",
+        "scripts": {
+            "build": "webpack build",
+            "test": "jest",
+            "dev": "webpack serve",
+            "lint": "eslint ."
+        },
+        "devDependencies": {
+            "jest": "^29.0.0",
+            "eslint": "^8.0.0",
+            "webpack": "^5.0.0"
         }
-        
-        with open(project_path / "package.json", "w") as f:
-            json.dump(package_json, f, indent=2)
-        
-        # Create basic .mise.toml
-        mise_config = """
+    }
+    
+    with open(project_path / "package.json", "w") as f:
+        json.dump(package_json, f, indent=2)
+    
+    # Create basic .mise.toml
+    mise_config = """
 [tools]
 node = "20"
 
@@ -76,11 +75,34 @@ description = "Run linting"
 run = "npm run lint"
 sources = ["src/**/*"]
 """
-        
-        with open(project_path / ".mise.toml", "w") as f:
-            f.write(mise_config.strip())
-        
-        yield project_path
+    
+    with open(project_path / ".mise.toml", "w") as f:
+        f.write(mise_config.strip())
+    
+    return project_path
+
+
+@pytest.fixture
+def temp_project_dir(request, tmp_path, _template_project_dir):
+    """Create a temporary project directory for testing"""
+    # Tests that only read the project can share the template without a copy
+    if request.node.get_closest_marker("readonly_project"):
+        return _template_project_dir
+    project_path = tmp_path / "project"
+    shutil.copytree(_template_project_dir, project_path, copy_function=shutil.copy)
+    return project_path
+
+
+@pytest.fixture(scope="session")
+def empty_tmp_project(tmp_path_factory):
+    """Existing but empty project directory; shared, so tests must not write to it"""
+    return tmp_path_factory.mktemp("empty_proj")
+
+
+@pytest.fixture
+def temp_project_path(temp_project_dir):
+    """String form of temp_project_dir, as passed to the server tools"""
+    return str(temp_project_dir)
 
 
 @pytest.fixture
@@ -412,6 +434,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "security: marks tests as security tests"
     )
+    config.addinivalue_line(
+        "markers", "readonly_project: test never writes to temp_project_dir, so it gets the shared template"
+    )
 
 
 # Test collection configuration
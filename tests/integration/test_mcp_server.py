@@ -16,13 +16,7 @@ from wise_mise_mcp.server import (
     validate_task_architecture,
     get_task_recommendations,
     prune_tasks,
-    remove_task,
-    AnalyzeProjectRequest,
-    TraceTaskChainRequest,
-    CreateTaskRequest,
-    ValidateArchitectureRequest,
-    PruneTasksRequest,
-    RemoveTaskRequest
+    remove_task
 )
 
 
@@ -40,8 +34,7 @@ class TestMCPServerIntegration:
             await self._create_react_nodejs_project(project_path)
             
             # Step 1: Analyze project structure
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            analysis_result = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            analysis_result = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             assert "error" not in analysis_result
             assert analysis_result["project_structure"]["package_managers"] == ["npm"]
@@ -66,8 +59,7 @@ class TestMCPServerIntegration:
                 assert len(domains_represented) > 0
             
             # Step 3: Validate architecture
-            validate_request = ValidateArchitectureRequest(project_path=str(project_path))
-            validation_result = await validate_task_architecture.fn(project_path=validate_request.project_path)
+            validation_result = await validate_task_architecture.fn(project_path=str(project_path))
             
             assert "error" not in validation_result
             
@@ -82,32 +74,21 @@ class TestMCPServerIntegration:
             await self._create_basic_nodejs_project(project_path)
             
             # Create a new task
-            create_request = CreateTaskRequest(
+            create_result = await create_task.fn(
                 project_path=str(project_path),
                 task_description="Run tests with coverage reporting",
                 suggested_name="coverage"
             )
             
-            create_result = await create_task.fn(
-                project_path=create_request.project_path,
-                task_description=create_request.task_description,
-                suggested_name=create_request.suggested_name
-            )
-            
             if "error" not in create_result and create_result.get("result", {}).get("success"):
                 # Task was created successfully, try to trace it
                 task_name = create_result["result"]["task_name"]
                 
-                trace_request = TraceTaskChainRequest(
+                trace_result = await trace_task_chain.fn(
                     project_path=str(project_path),
                     task_name=task_name
                 )
                 
-                trace_result = await trace_task_chain.fn(
-                    project_path=trace_request.project_path,
-                    task_name=trace_request.task_name
-                )
-                
                 if "error" not in trace_result:
                     assert trace_result["task_name"] == task_name
                     assert "execution_order" in trace_result
@@ -124,8 +105,7 @@ class TestMCPServerIntegration:
             await self._create_monorepo_project(project_path)
             
             # Analyze the complex project
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            result = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            result = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             assert "error" not in result
             
@@ -153,8 +133,7 @@ class TestMCPServerIntegration:
             await self._create_python_project(project_path)
             
             # Analyze Python project
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            result = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            result = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             assert "error" not in result
             
@@ -179,8 +158,7 @@ class TestMCPServerIntegration:
             await self._create_rust_project(project_path)
             
             # Analyze Rust project
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            result = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            result = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             assert "error" not in result
             
@@ -649,8 +627,7 @@ node = "18"  # Missing closing bracket
 run = "npm run build"  # Missing closing bracket
 """)
             
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            result = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            result = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             # Should handle TOML parsing errors gracefully
             # Either return error or work with partial parsing
@@ -662,8 +639,7 @@ run = "npm run build"  # Missing closing bracket
         """Test handling of permission-denied project directories"""
         # This test may not work in all environments
         try:
-            analyze_request = AnalyzeProjectRequest(project_path="/root/restricted")
-            result = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            result = await analyze_project_for_tasks.fn(project_path="/root/restricted")
             
             # Should return error instead of crashing
             assert isinstance(result, dict)
@@ -686,8 +662,7 @@ run = "npm run build"  # Missing closing bracket
             import time
             start_time = time.time()
             
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            result = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            result = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             end_time = time.time()
             analysis_time = end_time - start_time
@@ -759,12 +734,10 @@ run = "echo test"
 """)
             
             # Run multiple analysis requests concurrently
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            
             tasks = [
-                analyze_project_for_tasks.fn(project_path=analyze_request.project_path),
-                analyze_project_for_tasks.fn(project_path=analyze_request.project_path), 
-                analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+                analyze_project_for_tasks.fn(project_path=str(project_path)),
+                analyze_project_for_tasks.fn(project_path=str(project_path)), 
+                analyze_project_for_tasks.fn(project_path=str(project_path))
             ]
             
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -13,13 +13,7 @@ from wise_mise_mcp.server import (
     trace_task_chain,
     validate_task_architecture,
     prune_tasks,
-    remove_task,
-    AnalyzeProjectRequest,
-    CreateTaskRequest,
-    TraceTaskChainRequest,
-    ValidateArchitectureRequest,
-    PruneTasksRequest,
-    RemoveTaskRequest
+    remove_task
 )
 from wise_mise_mcp.models import MiseConfig
 
@@ -38,31 +32,24 @@ class TestTaskLifecycleWorkflows:
             await self._create_test_project(project_path)
             
             # Step 1: Analyze initial project
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            initial_analysis = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            initial_analysis = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             assert "error" not in initial_analysis
             initial_task_count = len(initial_analysis["existing_tasks"])
             
             # Step 2: Create a new task
-            create_request = CreateTaskRequest(
+            create_result = await create_task.fn(
                 project_path=str(project_path),
                 task_description="Generate test coverage report",
                 suggested_name="coverage"
             )
             
-            create_result = await create_task.fn(
-                project_path=create_request.project_path,
-                task_description=create_request.task_description,
-                suggested_name=create_request.suggested_name
-            )
-            
             if "error" not in create_result:
                 assert create_result.get("result", {}).get("success") is True
                 new_task_name = create_result["result"]["task_name"]
                 
                 # Step 3: Verify task was added
-                updated_analysis = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+                updated_analysis = await analyze_project_for_tasks.fn(project_path=str(project_path))
                 updated_task_count = len(updated_analysis["existing_tasks"])
                 
                 if create_result.get("result", {}).get("type") == "toml_task":
@@ -73,42 +60,31 @@ class TestTaskLifecycleWorkflows:
                     assert new_task_name in task_names
                 
                 # Step 4: Trace the new task
-                trace_request = TraceTaskChainRequest(
+                trace_result = await trace_task_chain.fn(
                     project_path=str(project_path),
                     task_name=new_task_name
                 )
                 
-                trace_result = await trace_task_chain.fn(
-                    project_path=trace_request.project_path,
-                    task_name=trace_request.task_name
-                )
-                
                 if "error" not in trace_result:
                     assert trace_result["task_name"] == new_task_name
                     assert "execution_order" in trace_result
                     
                 # Step 5: Validate architecture after changes
-                validate_request = ValidateArchitectureRequest(project_path=str(project_path))
-                validation_result = await validate_task_architecture.fn(project_path=validate_request.project_path)
+                validation_result = await validate_task_architecture.fn(project_path=str(project_path))
                 
                 assert "error" not in validation_result
                 
                 # Step 6: Remove the task
-                remove_request = RemoveTaskRequest(
+                remove_result = await remove_task.fn(
                     project_path=str(project_path),
                     task_name=new_task_name
                 )
                 
-                remove_result = await remove_task.fn(
-                    project_path=remove_request.project_path,
-                    task_name=remove_request.task_name
-                )
-                
                 if "error" not in remove_result:
                     assert remove_result["success"] is True
                     
                     # Step 7: Verify task was removed
-                    final_analysis = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+                    final_analysis = await analyze_project_for_tasks.fn(project_path=str(project_path))
                     final_task_count = len(final_analysis["existing_tasks"])
                     
                     if create_result.get("result", {}).get("type") == "toml_task":
@@ -146,33 +122,22 @@ class TestTaskLifecycleWorkflows:
             created_tasks = []
             
             for task_info in tasks_to_create:
-                create_request = CreateTaskRequest(
+                result = await create_task.fn(
                     project_path=str(project_path),
                     task_description=task_info["description"],
                     suggested_name=task_info["name"]
                 )
                 
-                result = await create_task.fn(
-                    project_path=create_request.project_path,
-                    task_description=create_request.task_description,
-                    suggested_name=create_request.suggested_name
-                )
-                
                 if "error" not in result and result.get("success"):
                     created_tasks.append(result["task_name"])
                     
             # Trace dependency chains for created tasks
             for task_name in created_tasks:
-                trace_request = TraceTaskChainRequest(
+                trace_result = await trace_task_chain.fn(
                     project_path=str(project_path),
                     task_name=task_name
                 )
                 
-                trace_result = await trace_task_chain.fn(
-                    project_path=trace_request.project_path,
-                    task_name=trace_request.task_name
-                )
-                
                 if "error" not in trace_result:
                     assert trace_result["task_name"] == task_name
                     # Should have execution order (even if just the task itself)
@@ -189,16 +154,11 @@ class TestTaskLifecycleWorkflows:
             await self._create_project_with_redundant_tasks(project_path)
             
             # Step 1: Analyze for redundant tasks (dry run)
-            prune_request = PruneTasksRequest(
+            dry_run_result = await prune_tasks.fn(
                 project_path=str(project_path),
                 dry_run=True
             )
             
-            dry_run_result = await prune_tasks.fn(
-                project_path=prune_request.project_path,
-                dry_run=prune_request.dry_run
-            )
-            
             assert "error" not in dry_run_result
             assert dry_run_result["dry_run"] is True
             
@@ -206,10 +166,9 @@ class TestTaskLifecycleWorkflows:
             
             if redundant_count > 0:
                 # Step 2: Actually prune redundant tasks
-                prune_request.dry_run = False
                 actual_prune_result = await prune_tasks.fn(
-                    project_path=prune_request.project_path,
-                    dry_run=prune_request.dry_run
+                    project_path=str(project_path),
+                    dry_run=False
                 )
                 
                 if "error" not in actual_prune_result:
@@ -217,8 +176,7 @@ class TestTaskLifecycleWorkflows:
                     assert "pruned_tasks" in actual_prune_result
                     
                     # Step 3: Verify tasks were removed
-                    analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-                    final_analysis = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+                    final_analysis = await analyze_project_for_tasks.fn(project_path=str(project_path))
                     
                     assert "error" not in final_analysis
                     
@@ -239,10 +197,8 @@ class TestTaskLifecycleWorkflows:
             # Start with minimal project
             await self._create_minimal_project(project_path)
             
-            validate_request = ValidateArchitectureRequest(project_path=str(project_path))
-            
             # Step 1: Initial validation
-            initial_validation = await validate_task_architecture.fn(project_path=validate_request.project_path)
+            initial_validation = await validate_task_architecture.fn(project_path=str(project_path))
             assert "error" not in initial_validation
             
             initial_issues = len(initial_validation.get("issues", []))
@@ -265,20 +221,14 @@ class TestTaskLifecycleWorkflows:
             ]
             
             for task_info in well_structured_tasks:
-                create_request = CreateTaskRequest(
+                await create_task.fn(
                     project_path=str(project_path),
                     task_description=task_info["description"],
                     suggested_name=task_info["name"]
                 )
                 
-                await create_task.fn(
-                    project_path=create_request.project_path,
-                    task_description=create_request.task_description,
-                    suggested_name=create_request.suggested_name
-                )
-                
             # Step 3: Validation after improvements
-            improved_validation = await validate_task_architecture.fn(project_path=validate_request.project_path)
+            improved_validation = await validate_task_architecture.fn(project_path=str(project_path))
             assert "error" not in improved_validation
             
             improved_issues = len(improved_validation.get("issues", []))
@@ -460,8 +410,7 @@ node = "18"
 """)
             
             # Analyze project - should recommend tasks based on scripts
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            analysis = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            analysis = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             assert "error" not in analysis
             recommendations = analysis["recommended_tasks"]
@@ -545,26 +494,18 @@ depends = ["test", "lint"]
             created_deploy_tasks = []
             
             for task_info in deployment_tasks:
-                create_request = CreateTaskRequest(
+                result = await create_task.fn(
                     project_path=str(project_path),
                     task_description=task_info["description"],
                     suggested_name=task_info["name"],
                     force_complexity="complex"  # Deployments are complex
                 )
                 
-                result = await create_task.fn(
-                    project_path=create_request.project_path,
-                    task_description=create_request.task_description,
-                    suggested_name=create_request.suggested_name,
-                    force_complexity=create_request.force_complexity
-                )
-                
                 if "error" not in result and result.get("success"):
                     created_deploy_tasks.append(result["task_name"])
                     
             # Validate the deployment workflow
-            validate_request = ValidateArchitectureRequest(project_path=str(project_path))
-            validation = await validate_task_architecture.fn(project_path=validate_request.project_path)
+            validation = await validate_task_architecture.fn(project_path=str(project_path))
             
             assert "error" not in validation
             
@@ -677,23 +618,17 @@ depends = ["build:all", "test:all"]
                 f.write(mise_tasks.strip())
                 
             # Analyze the complex monorepo
-            analyze_request = AnalyzeProjectRequest(project_path=str(project_path))
-            analysis = await analyze_project_for_tasks.fn(project_path=analyze_request.project_path)
+            analysis = await analyze_project_for_tasks.fn(project_path=str(project_path))
             
             assert "error" not in analysis
             assert len(analysis["existing_tasks"]) > 10  # Should have many tasks
             
             # Trace the CI task to see full dependency chain
-            trace_request = TraceTaskChainRequest(
+            trace_result = await trace_task_chain.fn(
                 project_path=str(project_path),
                 task_name="ci"
             )
             
-            trace_result = await trace_task_chain.fn(
-                project_path=trace_request.project_path,
-                task_name=trace_request.task_name
-            )
-            
             if "error" not in trace_result:
                 assert trace_result["task_name"] == "ci:ci"  # Server returns full domain-prefixed name
                 # Should have complex execution order
@@ -702,8 +637,7 @@ depends = ["build:all", "test:all"]
                 assert len(trace_result["parallelizable_groups"]) >= 2
                 
             # Validate architecture - should be well-structured
-            validate_request = ValidateArchitectureRequest(project_path=str(project_path))
-            validation = await validate_task_architecture.fn(project_path=validate_request.project_path)
+            validation = await validate_task_architecture.fn(project_path=str(project_path))
             
             assert "error" not in validation
             # Should use multiple domains
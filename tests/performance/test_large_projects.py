@@ -9,10 +9,7 @@ import json
 from pathlib import Path
 from typing import List
 
-from wise_mise_mcp.server import (
-    analyze_project_for_tasks,
-    AnalyzeProjectRequest
-)
+from wise_mise_mcp.server import analyze_project_for_tasks
 from wise_mise_mcp.analyzer import TaskAnalyzer
 from wise_mise_mcp.models import ProjectStructure
 
@@ -137,8 +134,7 @@ class TestLargeProjectPerformance:
             import asyncio
             
             async def run_analysis():
-                request = AnalyzeProjectRequest(project_path=str(project_path))
-                return await analyze_project_for_tasks.fn(project_path=request.project_path)
+                return await analyze_project_for_tasks.fn(project_path=str(project_path))
                 
             # Run concurrent analyses
             tasks = [run_analysis() for _ in range(num_concurrent)]
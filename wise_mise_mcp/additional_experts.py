@@ -20,7 +20,7 @@ class DeployExpert(DomainExpert):
         recommendations = []
 
         # Docker deployment
-        if (structure.root_path / "Dockerfile").exists():
+        if structure.has_entry("Dockerfile"):
             recommendations.append(
                 TaskRecommendation(
                     task=TaskDefinition(
@@ -39,7 +39,7 @@ class DeployExpert(DomainExpert):
             )
 
         # Kubernetes deployment
-        if (structure.root_path / "k8s").exists() or (structure.root_path / "kubernetes").exists():
+        if structure.has_entry("k8s") or structure.has_entry("kubernetes"):
             recommendations.append(
                 TaskRecommendation(
                     task=TaskDefinition(
@@ -60,7 +60,7 @@ class DeployExpert(DomainExpert):
         # Cloud deployment (Vercel, Netlify, etc.)
         if "npm" in structure.package_managers:
             package_json = structure.root_path / "package.json"
-            if package_json.exists():
+            if structure.has_entry("package.json"):
                 with open(package_json) as f:
                     data = json.load(f)
                     scripts = data.get("scripts", {})
@@ -103,7 +103,7 @@ class DbExpert(DomainExpert):
 
         # Database migrations
         migration_dirs = ["migrations", "migrate", "db/migrations"]
-        if any((structure.root_path / mdir).exists() for mdir in migration_dirs):
+        if any(structure.has_entry(mdir) for mdir in migration_dirs):
             recommendations.append(
                 TaskRecommendation(
                     task=TaskDefinition(
@@ -120,7 +120,7 @@ class DbExpert(DomainExpert):
             )
 
         # Database seeding
-        if (structure.root_path / "seeds").exists() or (structure.root_path / "db/seeds").exists():
+        if structure.has_entry("seeds") or structure.has_entry("db/seeds"):
             recommendations.append(
                 TaskRecommendation(
                     task=TaskDefinition(
@@ -244,7 +244,7 @@ class DocsExpert(DomainExpert):
             return recommendations
 
         # Documentation generation
-        if (structure.root_path / "docs").exists():
+        if structure.has_entry("docs"):
             recommendations.append(
                 TaskRecommendation(
                     task=TaskDefinition(
@@ -279,7 +279,7 @@ class DocsExpert(DomainExpert):
         # API documentation
         if "npm" in structure.package_managers:
             package_json = structure.root_path / "package.json"
-            if package_json.exists():
+            if structure.has_entry("package.json"):
                 with open(package_json) as f:
                     data = json.load(f)
                     deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
@@ -459,7 +459,7 @@ class SetupExpert(DomainExpert):
         )
 
         # Git hooks setup
-        if (structure.root_path / ".git").exists():
+        if structure.has_entry(".git"):
             recommendations.append(
                 TaskRecommendation(
                     task=TaskDefinition(
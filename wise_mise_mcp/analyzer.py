@@ -2,12 +2,20 @@
 Task analysis and management utilities
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, cast
 from pathlib import Path
+import threading
 import networkx as nx
-from collections import defaultdict
-
-from .models import TaskDefinition, TaskDomain, MiseConfig, ProjectStructure, TaskRecommendation
+from collections import OrderedDict, defaultdict
+
+from .models import (
+    TaskDefinition,
+    TaskDomain,
+    MiseConfig,
+    ProjectStructure,
+    TaskRecommendation,
+    _config_signature,
+)
 from .experts import DomainExpert, BuildExpert, TestExpert, LintExpert, DevExpert
 from .additional_experts import (
     DeployExpert,
@@ -18,13 +26,23 @@ from .additional_experts import (
     SetupExpert,
 )
 
+# Parsed tasks + dependency graph per .mise.toml, keyed by the file's stat
+# signature so repeated tool calls on an unchanged config skip the rebuild
+_GRAPH_CACHE_SIZE = 32
+_graph_cache: "OrderedDict[Tuple, Tuple[List[TaskDefinition], nx.DiGraph]]" = OrderedDict()
+# Tools call in from asyncio.to_thread workers; guards the LRU bookkeeping, not the build
+_graph_cache_lock = threading.Lock()
+
 
 class TaskAnalyzer:
     """Analyzes mise task configurations and dependencies"""
 
     def __init__(self, project_path: Path):
         self.project_path = project_path
-        self.mise_config = MiseConfig.load_from_file(project_path / ".mise.toml")
+        config_path = project_path / ".mise.toml"
+        # Taken before loading, so a rewrite racing the load can't cache old contents under the new key
+        self._config_signature = _config_signature(config_path)
+        self.mise_config = MiseConfig.load_from_file(config_path)
         self.experts: List[DomainExpert] = [
             BuildExpert(),
             TestExpert(),
@@ -104,10 +122,14 @@ class TaskAnalyzer:
 
         # Create mapping from simple name to full name
         name_to_full = {}
+        # First task per simple name, for resolving user-supplied names in find_task
+        by_simple_name: Dict[str, TaskDefinition] = {}
         for task in tasks:
             name_to_full[task.name] = task.full_name
             # Also map full name to itself for flexibility
             name_to_full[task.full_name] = task.full_name
+            by_simple_name.setdefault(task.name, task)
+        graph.graph["tasks_by_name"] = by_simple_name
 
         # Add all tasks as nodes
         for task in tasks:
@@ -135,20 +157,47 @@ class TaskAnalyzer:
 
         return graph
 
+    def tasks_and_graph(self) -> Tuple[List[TaskDefinition], nx.DiGraph]:
+        """Existing tasks and their dependency graph, shared while the config is unchanged"""
+        if self._config_signature is None:
+            tasks = self.extract_existing_tasks()
+            return tasks, self.build_dependency_graph(tasks)
+
+        key = (str(self.project_path), self._config_signature)
+        with _graph_cache_lock:
+            cached = _graph_cache.get(key)
+            if cached is not None:
+                _graph_cache.move_to_end(key)
+                return cached
+
+        tasks = self.extract_existing_tasks()
+        built = (tasks, self.build_dependency_graph(tasks))
+        with _graph_cache_lock:
+            # Another thread may have built the same config meanwhile; share the first
+            cached = _graph_cache.setdefault(key, built)
+            _graph_cache.move_to_end(key)
+            if len(_graph_cache) > _GRAPH_CACHE_SIZE:
+                _graph_cache.popitem(last=False)
+        return cached
+
+    def find_task(self, task_name: str) -> Optional[TaskDefinition]:
+        """Resolve a full or simple task name to its definition"""
+        _, graph = self.tasks_and_graph()
+        if task_name in graph:
+            return cast(TaskDefinition, graph.nodes[task_name]["task"])
+        by_simple_name: Dict[str, TaskDefinition] = graph.graph["tasks_by_name"]
+        return by_simple_name.get(task_name)
+
     def trace_task_chain(self, task_name: str) -> Dict[str, any]:
         """Trace the full execution chain for a task"""
-        tasks = self.extract_existing_tasks()
-        graph = self.build_dependency_graph(tasks)
+        _, graph = self.tasks_and_graph()
 
         # Try to resolve task name to full name if needed
         if task_name not in graph:
-            # Try to find by simple name
-            for task in tasks:
-                if task.name == task_name:
-                    task_name = task.full_name
-                    break
-            else:
+            task = self.find_task(task_name)
+            if task is None:
                 return {"error": f"Task '{task_name}' not found"}
+            task_name = task.full_name
 
         # Find all predecessors (dependencies)
         predecessors = list(nx.ancestors(graph, task_name))
@@ -184,23 +233,22 @@ class TaskAnalyzer:
 
     def _find_parallel_groups(self, graph: nx.DiGraph) -> List[List[str]]:
         """Find groups of tasks that can run in parallel"""
+        # Kahn's algorithm, a level at a time: every node and edge is visited once
+        in_degree = dict(graph.in_degree())
+        current_level = [node for node, degree in in_degree.items() if degree == 0]
         levels = []
-        remaining = set(graph.nodes())
-
-        while remaining:
-            # Find nodes with no dependencies among remaining nodes
-            current_level = []
-            for node in remaining:
-                deps = set(graph.predecessors(node))
-                if not (deps & remaining):  # No remaining dependencies
-                    current_level.append(node)
-
-            if not current_level:
-                break  # Circular dependency
 
+        while current_level:
             levels.append(current_level)
-            remaining -= set(current_level)
-
+            next_level = []
+            for node in current_level:
+                for successor in graph.successors(node):
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        next_level.append(successor)
+            current_level = next_level
+
+        # Nodes on (or behind) a circular dependency never reach in-degree 0
         return levels
 
     def get_task_recommendations(self) -> List[TaskRecommendation]:
@@ -232,8 +280,7 @@ class TaskAnalyzer:
 
     def validate_task_architecture(self) -> Dict[str, any]:
         """Validate that the current task setup follows best practices"""
-        tasks = self.extract_existing_tasks()
-        graph = self.build_dependency_graph(tasks)
+        tasks, graph = self.tasks_and_graph()
 
         issues = []
         suggestions = []
@@ -43,7 +43,7 @@ class BuildExpert(DomainExpert):
         if "npm" in structure.package_managers:
             # Check package.json for build scripts
             package_json = structure.root_path / "package.json"
-            if package_json.exists():
+            if structure.has_entry("package.json"):
                 with open(package_json) as f:
                     data = json.load(f)
                     scripts = data.get("scripts", {})
@@ -125,7 +125,7 @@ class BuildExpert(DomainExpert):
 
         # Python builds
         if "python" in structure.languages:
-            if (structure.root_path / "pyproject.toml").exists():
+            if structure.has_entry("pyproject.toml"):
                 recommendations.append(
                     TaskRecommendation(
                         task=TaskDefinition(
@@ -165,7 +165,7 @@ class TestExpert(DomainExpert):
         # JavaScript testing
         if "npm" in structure.package_managers:
             package_json = structure.root_path / "package.json"
-            if package_json.exists():
+            if structure.has_entry("package.json"):
                 with open(package_json) as f:
                     data = json.load(f)
                     scripts = data.get("scripts", {})
@@ -280,7 +280,7 @@ class LintExpert(DomainExpert):
         # JavaScript linting
         if "npm" in structure.package_managers:
             package_json = structure.root_path / "package.json"
-            if package_json.exists():
+            if structure.has_entry("package.json"):
                 with open(package_json) as f:
                     data = json.load(f)
                     deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
@@ -415,7 +415,7 @@ class DevExpert(DomainExpert):
         # Development server tasks
         if "npm" in structure.package_managers:
             package_json = structure.root_path / "package.json"
-            if package_json.exists():
+            if structure.has_entry("package.json"):
                 with open(package_json) as f:
                     data = json.load(f)
                     scripts = data.get("scripts", {})
@@ -2,9 +2,10 @@
 Task creation and management utilities
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from pathlib import Path
 import os
+import threading
 
 from .models import (
     TaskDefinition,
@@ -14,6 +15,10 @@ from .models import (
 )
 from .analyzer import TaskAnalyzer
 
+# Serializes read-modify-write cycles on .mise.toml (and the generated docs)
+# so tool calls running in worker threads can't drop each other's updates
+_config_lock = threading.Lock()
+
 
 class TaskManager:
     """Manages creation, modification, and organization of mise tasks"""
@@ -320,92 +325,143 @@ echo "✅ {task_def.name} completed successfully"
     def _add_task_to_config(self, task_def: TaskDefinition) -> Dict[str, Any]:
         """Add task to mise configuration"""
         try:
-            # Load current config
-            config = MiseConfig.load_from_file(self.mise_config_path)
+            with _config_lock:
+                # Load current config
+                config = MiseConfig.load_from_file(self.mise_config_path)
 
-            # For file tasks, just ensure the file exists (mise auto-discovers)
-            if task_def.is_file_task:
-                return {
-                    "success": True,
-                    "task_name": task_def.full_name,
-                    "type": "file_task",
-                    "file_path": str(task_def.file_path),
-                    "message": f"Created file task at {task_def.file_path}",
-                }
+                # For file tasks, just ensure the file exists (mise auto-discovers)
+                if task_def.is_file_task:
+                    return {
+                        "success": True,
+                        "task_name": task_def.full_name,
+                        "type": "file_task",
+                        "file_path": str(task_def.file_path),
+                        "message": f"Created file task at {task_def.file_path}",
+                    }
 
-            # For TOML tasks, add to configuration
-            task_config = {}
+                # For TOML tasks, add to configuration
+                task_config = {}
 
-            if task_def.description:
-                task_config["description"] = task_def.description
+                if task_def.description:
+                    task_config["description"] = task_def.description
 
-            if isinstance(task_def.run, list) and len(task_def.run) == 1:
-                task_config["run"] = task_def.run[0]
-            else:
-                task_config["run"] = task_def.run
+                if isinstance(task_def.run, list) and len(task_def.run) == 1:
+                    task_config["run"] = task_def.run[0]
+                else:
+                    task_config["run"] = task_def.run
 
-            if task_def.depends:
-                task_config["depends"] = task_def.depends
+                if task_def.depends:
+                    task_config["depends"] = task_def.depends
 
-            if task_def.sources:
-                task_config["sources"] = task_def.sources
+                if task_def.sources:
+                    task_config["sources"] = task_def.sources
 
-            if task_def.outputs:
-                task_config["outputs"] = task_def.outputs
+                if task_def.outputs:
+                    task_config["outputs"] = task_def.outputs
 
-            if task_def.env:
-                task_config["env"] = task_def.env
+                if task_def.env:
+                    task_config["env"] = task_def.env
 
-            if task_def.alias:
-                task_config["alias"] = task_def.alias
+                if task_def.alias:
+                    task_config["alias"] = task_def.alias
 
-            if task_def.hide:
-                task_config["hide"] = task_def.hide
+                if task_def.hide:
+                    task_config["hide"] = task_def.hide
 
-            # Add to config
-            config.tasks[task_def.full_name] = task_config
+                # Add to config
+                config.tasks[task_def.full_name] = task_config
 
-            # Save config
-            config.save_to_file(self.mise_config_path)
+                # Save config
+                config.save_to_file(self.mise_config_path)
 
-            return {
-                "success": True,
-                "task_name": task_def.full_name,
-                "type": "toml_task",
-                "message": f"Added task '{task_def.full_name}' to .mise.toml",
-            }
+                return {
+                    "success": True,
+                    "task_name": task_def.full_name,
+                    "type": "toml_task",
+                    "message": f"Added task '{task_def.full_name}' to .mise.toml",
+                }
 
         except Exception as e:
             return {"error": f"Failed to add task: {str(e)}"}
 
     def remove_task(self, task_name: str) -> Dict[str, Any]:
-        """Remove a task from configuration"""
-        try:
-            # Load current config
-            config = MiseConfig.load_from_file(self.mise_config_path)
+        """Remove a task from configuration, reporting the tasks that depended on it"""
+        # The analyzer only knows TOML tasks; anything else may still be a file task
+        tasks, graph = self.analyzer.tasks_and_graph()
+        target_task = self.analyzer.find_task(task_name)
+        config_name = target_task.name if target_task else task_name
+
+        result = self.remove_tasks([config_name])[config_name]
+        if "error" in result:
+            if target_task is None:
+                result["available_tasks"] = [task.full_name for task in tasks]
+            return result
+
+        if target_task:
+            result["removed_task"] = {
+                "name": target_task.full_name,
+                "domain": target_task.domain.value,
+                "description": target_task.description,
+            }
+            dependents = self.analyzer.find_dependent_tasks(target_task, graph)
+        else:
+            domain = task_name.split(":", 1)[0] if ":" in task_name else "misc"
+            result["removed_task"] = {"name": task_name, "domain": domain, "description": ""}
+            dependents = []
+        result["dependents"] = [
+            {"name": task.full_name, "domain": task.domain.value} for task in dependents
+        ]
+        return result
 
-            # Check if task exists in TOML
-            if task_name in config.tasks:
-                del config.tasks[task_name]
-                config.save_to_file(self.mise_config_path)
-                return {"success": True, "message": f"Removed TOML task '{task_name}'"}
+    def remove_tasks(self, task_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Remove several tasks, rewriting the configuration at most once"""
+        results = {}
+        toml_removed = []
+        try:
+            with _config_lock:
+                # Load current config
+                config = MiseConfig.load_from_file(self.mise_config_path)
+
+                for task_name in task_names:
+                    # Check if task exists in TOML
+                    if task_name in config.tasks:
+                        del config.tasks[task_name]
+                        toml_removed.append(task_name)
+                        continue
+
+                    # Check for file task
+                    task_file = self._find_task_file(task_name)
+                    if task_file and task_file.exists() and self._in_tasks_dir(task_file):
+                        task_file.unlink()
+                        results[task_name] = {
+                            "success": True,
+                            "message": f"Removed file task '{task_name}' at {task_file}",
+                        }
+                    else:
+                        results[task_name] = {"error": f"Task '{task_name}' not found"}
+
+                if toml_removed:
+                    config.save_to_file(self.mise_config_path)
 
-            # Check for file task
-            task_file = self._find_task_file(task_name)
-            if task_file and task_file.exists():
-                task_file.unlink()
-                return {
-                    "success": True,
-                    "message": f"Removed file task '{task_name}' at {task_file}",
-                }
+        except Exception as e:
+            # TOML removals only take effect with the save; file removals already happened
+            error = {"error": f"Failed to remove task: {str(e)}"}
+            return {task_name: results.get(task_name, error) for task_name in task_names}
 
-            return {"error": f"Task '{task_name}' not found"}
+        for task_name in toml_removed:
+            results[task_name] = {"success": True, "message": f"Removed TOML task '{task_name}'"}
+        return results
 
-        except Exception as e:
-            return {"error": f"Failed to remove task: {str(e)}"}
+    def _in_tasks_dir(self, path: Path) -> bool:
+        """Whether path, with symlinks resolved, lies inside .mise/tasks"""
+        return path.resolve().is_relative_to(self.tasks_dir.resolve())
 
     def _find_task_file(self, task_name: str) -> Optional[Path]:
         """Find the file for a given task name"""
+        # Task names come from tool callers; never let one address a path outside .mise/tasks
+        if os.path.isabs(task_name) or "/" in task_name or "\\" in task_name or ".." in task_name:
+            return None
+
         # Extract domain and name
         if ":" in task_name:
             domain, name = task_name.split(":", 1)
@@ -468,7 +524,7 @@ echo "✅ {task_def.name} completed successfully"
 
                     content += f"**Usage:** `mise run {task.full_name}`\n\n"
 
-            with open(readme_path, "w") as f:
+            with _config_lock, open(readme_path, "w") as f:
                 f.write(content)
         except Exception:
             # Don't fail if documentation update fails
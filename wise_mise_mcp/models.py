@@ -2,17 +2,56 @@
 Core models and data structures for mise task management
 """
 
-from typing import Dict, List, Optional, Set, Union, Any
+import copy
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union, Any
 from enum import Enum
 from dataclasses import dataclass, field
 from pathlib import Path
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib
+import tomllib
 import tomli_w
 
 
+def _config_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Identify a config file's current contents (None if it doesn't exist)"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    # Atomic saves swap in a new inode, so ino catches rewrites within one mtime tick
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry change (such as a rename) to disk, where supported"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=32)
+def _parse_toml(path_str: str, signature: Tuple[int, int, int]) -> Dict[str, Any]:
+    """Parse a TOML file; the signature in the key makes any rewrite a cache miss"""
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
+# Signature and digest of the bytes save_to_file last wrote, keyed by path; an
+# LRU the size of the server's analyzer/manager caches, so it doesn't grow forever
+_LAST_SAVED_SIZE = 32
+_last_saved: "OrderedDict[str, Tuple[Optional[Tuple[int, int, int]], bytes]]" = OrderedDict()
+_last_saved_lock = threading.Lock()
+
+
 class TaskDomain(Enum):
     """Core mise task domains"""
 
@@ -36,7 +75,7 @@ class TaskComplexity(Enum):
     COMPLEX = "complex"  # Requires file task with script
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDefinition:
     """Represents a mise task definition"""
 
@@ -56,13 +95,12 @@ class TaskDefinition:
     confirm: Optional[str] = None
     complexity: TaskComplexity = TaskComplexity.SIMPLE
     file_path: Optional[Path] = None  # For file tasks
+    # Full task name with domain prefix; name and domain never change after
+    # construction, so it is computed once instead of on every access
+    full_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def full_name(self) -> str:
-        """Get the full task name with domain prefix"""
-        if ":" in self.name:
-            return self.name
-        return f"{self.domain.value}:{self.name}"
+    def __post_init__(self) -> None:
+        self.full_name = self.name if ":" in self.name else f"{self.domain.value}:{self.name}"
 
     @property
     def is_file_task(self) -> bool:
@@ -70,7 +108,7 @@ class TaskDefinition:
         return self.file_path is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class MiseConfig:
     """Represents a mise.toml configuration"""
 
@@ -83,11 +121,12 @@ class MiseConfig:
     @classmethod
     def load_from_file(cls, path: Path) -> "MiseConfig":
         """Load mise configuration from a TOML file"""
-        if not path.exists():
+        signature = _config_signature(path)
+        if signature is None:
             return cls()
 
-        with open(path, "rb") as f:
-            data = tomllib.load(f)
+        # Callers edit the loaded tables in place, so never hand out the cached parse itself
+        data = copy.deepcopy(_parse_toml(str(path), signature))
 
         return cls(
             tools=data.get("tools", {}),
@@ -112,11 +151,66 @@ class MiseConfig:
         if self.task_config:
             data["task_config"] = self.task_config
 
-        with open(path, "wb") as f:
-            tomli_w.dump(data, f)
-
-
-@dataclass
+        buf = tomli_w.dumps(data).encode()
+        digest = hashlib.blake2b(buf, digest_size=16).digest()
+        key = str(path)
+
+        # Nothing to do if we wrote these exact bytes and the file hasn't changed since
+        with _last_saved_lock:
+            last = _last_saved.get(key)
+            if last is not None and last == (_config_signature(path), digest):
+                _last_saved.move_to_end(key)
+                return
+
+        # Write to a uniquely named sibling temp file, flush it to disk and swap it
+        # in, so a crash mid-write never leaves a truncated config behind and
+        # concurrent writers can't clobber each other's temp file. Going through
+        # the resolved path keeps a symlinked .mise.toml a symlink.
+        target = path.resolve()
+        tmp_name = str(target.parent / f".{target.name}.{os.urandom(6).hex()}.tmp")
+        # Created 0666 like a plain open() would, so the kernel applies the umask
+        # and a brand new config gets the usual mode
+        fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(buf)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            # An existing config keeps the mode it had
+            try:
+                shutil.copymode(target, tmp_name)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        _fsync_dir(target.parent)
+        with _last_saved_lock:
+            _last_saved[key] = (_config_signature(path), digest)
+            _last_saved.move_to_end(key)
+            if len(_last_saved) > _LAST_SAVED_SIZE:
+                _last_saved.popitem(last=False)
+
+
+# Top-level names whose presence marks a project feature in ProjectStructure.analyze
+_TEST_DIRS = frozenset({"tests", "test", "__tests__", "spec"})
+_DOC_DIRS = frozenset({"docs", "doc", "documentation"})
+_CI_FILES = frozenset({".gitlab-ci.yml", "Jenkinsfile", ".circleci"})
+_DB_FILES = frozenset({"migrations", "schema.sql", "models", "alembic"})
+
+
+def _folds_case(path: Path, names: Set[str]) -> bool:
+    """Whether the filesystem at path treats names differing only in case as one"""
+    # One probe: ask for a listed name with its case swapped
+    for name in names:
+        swapped = name.swapcase()
+        if swapped != name and swapped not in names:
+            return os.path.exists(os.path.join(path, swapped))
+    return False
+
+
+@dataclass(slots=True)
 class ProjectStructure:
     """Represents the structure of a project for analysis"""
 
@@ -130,54 +224,75 @@ class ProjectStructure:
     has_database: bool = False
     build_artifacts: List[str] = field(default_factory=list)
     source_dirs: List[str] = field(default_factory=list)
+    # Names in root_path as listed by analyze, casefolded where the filesystem
+    # ignores case; None for hand-built structures
+    root_entries: Optional[FrozenSet[str]] = field(default=None, repr=False, compare=False)
+    root_entries_folded: bool = field(default=False, repr=False, compare=False)
+
+    def has_entry(self, name: str) -> bool:
+        """Check whether a file or directory exists relative to the project root"""
+        if self.root_entries is not None and "/" not in name:
+            return (name.casefold() if self.root_entries_folded else name) in self.root_entries
+        return (self.root_path / name).exists()
 
     @classmethod
     def analyze(cls, path: Path) -> "ProjectStructure":
         """Analyze a project directory structure"""
         structure = cls(root_path=path)
 
+        # List the root once instead of stat-ing every candidate name
+        entries = set()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    # A dangling symlink doesn't give the project that file
+                    if entry.is_symlink() and not os.path.exists(entry.path):
+                        continue
+                    entries.add(entry.name)
+        except OSError:
+            pass
+        if _folds_case(path, entries):
+            structure.root_entries = frozenset(name.casefold() for name in entries)
+            structure.root_entries_folded = True
+        else:
+            structure.root_entries = frozenset(entries)
+        has_entry = structure.has_entry
+
         # Check for package managers
-        if (path / "package.json").exists():
+        if has_entry("package.json"):
             structure.package_managers.add("npm")
             structure.languages.add("javascript")
-        if (path / "Cargo.toml").exists():
+        if has_entry("Cargo.toml"):
             structure.package_managers.add("cargo")
             structure.languages.add("rust")
-        if (path / "pyproject.toml").exists() or (path / "setup.py").exists():
+        if has_entry("pyproject.toml") or has_entry("setup.py"):
             structure.package_managers.add("pip")
             structure.languages.add("python")
-        if (path / "go.mod").exists():
+        if has_entry("go.mod"):
             structure.package_managers.add("go")
             structure.languages.add("go")
 
         # Check for common directories
-        if (path / "src").exists():
+        if has_entry("src"):
             structure.source_dirs.append("src")
-        if (path / "lib").exists():
+        if has_entry("lib"):
             structure.source_dirs.append("lib")
-        if (path / "app").exists():
+        if has_entry("app"):
             structure.source_dirs.append("app")
 
-        # Check for tests
-        test_dirs = ["tests", "test", "__tests__", "spec"]
-        structure.has_tests = any((path / test_dir).exists() for test_dir in test_dirs)
-
-        # Check for docs
-        doc_dirs = ["docs", "doc", "documentation"]
-        structure.has_docs = any((path / doc_dir).exists() for doc_dir in doc_dirs)
-
-        # Check for CI
-        ci_files = [".github/workflows", ".gitlab-ci.yml", "Jenkinsfile", ".circleci"]
-        structure.has_ci = any((path / ci_file).exists() for ci_file in ci_files)
-
-        # Check for database
-        db_files = ["migrations", "schema.sql", "models", "alembic"]
-        structure.has_database = any((path / db_file).exists() for db_file in db_files)
+        # Check for tests, docs, CI and database
+        structure.has_tests = any(map(has_entry, _TEST_DIRS))
+        structure.has_docs = any(map(has_entry, _DOC_DIRS))
+        # .github/workflows is the one nested probe; only stat it when .github exists
+        structure.has_ci = any(map(has_entry, _CI_FILES)) or (
+            has_entry(".github") and os.path.exists(os.path.join(path, ".github", "workflows"))
+        )
+        structure.has_database = any(map(has_entry, _DB_FILES))
 
         return structure
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskRecommendation:
     """Represents a recommended task to add or modify"""
 
@@ -2,59 +2,116 @@
 FastMCP server for intelligent mise task management
 """
 
+import asyncio
+import os
 import sys
+from functools import lru_cache, wraps
 from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-from .models import TaskDomain, TaskComplexity
-from .analyzer import TaskAnalyzer
-from .manager import TaskManager
+from .models import TaskDomain, TaskComplexity, _config_signature
 
-# Get version from package metadata
-try:
-    __version__ = version("wise-mise-mcp")
-except PackageNotFoundError:
-    __version__ = "dev"
+if TYPE_CHECKING:
+    # Imported on first use instead: both pull in networkx, which --help,
+    # /health and a server that never gets a tool call don't need
+    from .analyzer import TaskAnalyzer
+    from .manager import TaskManager
+    from starlette.middleware import Middleware
+    from starlette.middleware.base import RequestResponseEndpoint
+    from starlette.requests import Request
+    from starlette.responses import Response
 
 
-# Request/Response models
-class AnalyzeProjectRequest(BaseModel):
-    project_path: str = Field(description="Path to the project directory")
+def _detect_version() -> str:
+    """Get version from package metadata, or "dev" for a source checkout"""
+    try:
+        return version("wise-mise-mcp")
+    except PackageNotFoundError:
+        return "dev"
+
+
+__version__ = _detect_version()
+
+
+# Analyzers and managers only read .mise.toml when built, so tool calls on an
+# unchanged config share one; a rewrite changes the signature and misses
+@lru_cache(maxsize=32)
+def _cached_analyzer(project_path: Path, signature: Optional[Tuple[int, int, int]]) -> "TaskAnalyzer":
+    from .analyzer import TaskAnalyzer
+
+    return TaskAnalyzer(project_path)
+
+
+@lru_cache(maxsize=32)
+def _cached_manager(project_path: Path, signature: Optional[Tuple[int, int, int]]) -> "TaskManager":
+    from .manager import TaskManager
+
+    return TaskManager(project_path)
 
 
-class TraceTaskChainRequest(BaseModel):
-    project_path: str = Field(description="Path to the project directory")
-    task_name: str = Field(description="Name of the task to trace")
+def _get_analyzer(project_path: Path) -> "TaskAnalyzer":
+    """TaskAnalyzer for the project's current .mise.toml"""
+    return _cached_analyzer(project_path, _config_signature(project_path / ".mise.toml"))
 
 
-class CreateTaskRequest(BaseModel):
-    project_path: str = Field(description="Path to the project directory")
-    task_description: str = Field(description="Description of what the task should do")
-    suggested_name: Optional[str] = Field(None, description="Suggested task name")
-    force_complexity: Optional[str] = Field(
-        None, description="Force complexity level (simple/moderate/complex)"
-    )
-    domain_hint: Optional[str] = Field(
-        None, description="Hint about which domain this task belongs to"
-    )
+def _get_manager(project_path: Path) -> "TaskManager":
+    """TaskManager for the project's current .mise.toml"""
+    return _cached_manager(project_path, _config_signature(project_path / ".mise.toml"))
 
 
-class ValidateArchitectureRequest(BaseModel):
-    project_path: str = Field(description="Path to the project directory")
+def _config_names(analyzer: "TaskAnalyzer", task_names: List[str]) -> List[str]:
+    """Map the analyzer's full task names ("build:lonely") to their config keys ("lonely")"""
+    config_names = []
+    for task_name in task_names:
+        task = analyzer.find_task(task_name) if task_name else None
+        config_names.append(task.name if task else task_name)
+    return config_names
 
 
-class PruneTasksRequest(BaseModel):
-    project_path: str = Field(description="Path to the project directory")
-    dry_run: bool = Field(True, description="Whether to only report what would be pruned")
+# System directories the project tools refuse to look into
+_DANGEROUS_PATHS = ('/etc', '/proc', '/sys', '/dev', '/bin', '/sbin', '/usr/bin', '/usr/sbin')
+# With the separator, so /devel or /etc-backup aren't mistaken for /dev or /etc
+_DANGEROUS_PREFIXES = tuple(p + os.sep for p in _DANGEROUS_PATHS)
 
+_Tool = Callable[..., Awaitable[Dict[str, Any]]]
 
-class RemoveTaskRequest(BaseModel):
-    project_path: str = Field(description="Path to the project directory")
-    task_name: str = Field(description="Name of the task to remove")
+
+def _validated_project_path(tool: _Tool) -> _Tool:
+    """Return an error dict for unsafe or missing project paths instead of running the tool"""
+    @wraps(tool)
+    async def wrapper(project_path: str, **kwargs: Any) -> Dict[str, Any]:
+        project_path_obj = Path(project_path)
+        # Both hit the filesystem and raise on names the OS rejects (too long, NUL bytes)
+        try:
+            resolved_path = str(project_path_obj.resolve())
+            exists = project_path_obj.exists()
+        except (OSError, ValueError) as e:
+            return {"error": f"Invalid project path {project_path}: {str(e)}"}
+
+        # Security validation: reject potentially dangerous paths
+        if resolved_path in _DANGEROUS_PATHS or resolved_path.startswith(_DANGEROUS_PREFIXES):
+            return {"error": f"Access denied: {project_path} is not allowed for security reasons"}
+
+        # Check for path traversal attempts. Symlinks are fine (macOS /tmp is one);
+        # the system directory check above already ran on where they lead
+        if '..' in project_path_obj.parts:
+            return {"error": f"Access denied: Path traversal detected in {project_path}"}
+
+        if not exists:
+            return {"error": f"Project path {project_path} does not exist"}
+
+        return await tool(project_path=project_path, **kwargs)
+
+    return wrapper
+
+
+# Accepted create_task hints, in enum declaration order for the error messages
+_COMPLEXITY_BY_VALUE = {c.value: c for c in TaskComplexity}
+_DOMAIN_BY_VALUE = {d.value: d for d in TaskDomain}
 
 
 # Initialize FastMCP
@@ -62,8 +119,9 @@ app = FastMCP("Wise Mise MCP")
 
 
 @app.tool()
+@_validated_project_path
 async def analyze_project_for_tasks(
-    project_path: str = Field(description="Path to the project directory")
+    project_path: Annotated[str, Field(description="Path to the project directory")]
 ) -> Dict[str, Any]:
     """
     Analyze a project structure and extract strategic task recommendations.
@@ -75,40 +133,45 @@ async def analyze_project_for_tasks(
     """
     try:
         project_path_obj = Path(project_path)
-        
-        # Security validation: reject potentially dangerous paths
-        dangerous_paths = ['/etc', '/proc', '/sys', '/dev', '/bin', '/sbin', '/usr/bin', '/usr/sbin']
-        resolved_path = project_path_obj.resolve()
-        
-        # Check if path is in dangerous system directories
-        for dangerous in dangerous_paths:
-            if str(resolved_path).startswith(dangerous):
-                return {"error": f"Access denied: {project_path} is not allowed for security reasons"}
-        
-        # Check for path traversal attempts
-        if '..' in str(project_path_obj) or str(resolved_path) != str(project_path_obj.absolute()):
-            return {"error": f"Access denied: Path traversal detected in {project_path}"}
-        
-        if not project_path_obj.exists():
-            return {"error": f"Project path {project_path} does not exist"}
 
-        analyzer = TaskAnalyzer(project_path_obj)
+        # Loading the config and scanning the tree are blocking I/O; keep them off the event loop
+        analyzer = await asyncio.to_thread(_get_analyzer, project_path_obj)
 
         # Analyze project structure
-        structure = analyzer.analyze_project_structure()
+        structure = await asyncio.to_thread(analyzer.analyze_project_structure)
 
         # Get task recommendations
-        recommendations = analyzer.get_task_recommendations()
+        recommendations = await asyncio.to_thread(analyzer.get_task_recommendations)
 
         # Get existing tasks for context
-        existing_tasks = analyzer.extract_existing_tasks()
+        existing_tasks = await asyncio.to_thread(analyzer.extract_existing_tasks)
+
+        # One pass over the recommendations also collects the domains they cover
+        recommended_tasks = []
+        domains_covered = set()
+        for rec in recommendations:
+            task = rec.task
+            domain = task.domain.value
+            domains_covered.add(domain)
+            recommended_tasks.append(
+                {
+                    "name": task.full_name,
+                    "domain": domain,
+                    "description": task.description,
+                    "complexity": task.complexity.value,
+                    "reasoning": rec.reasoning,
+                    "priority": rec.priority,
+                    "estimated_effort": rec.estimated_effort,
+                    "dependencies_needed": rec.dependencies_needed,
+                }
+            )
 
         return {
             "project_path": str(project_path_obj),
             "project_structure": {
-                "package_managers": list(structure.package_managers),
-                "languages": list(structure.languages),
-                "frameworks": list(structure.frameworks),
+                "package_managers": sorted(structure.package_managers),
+                "languages": sorted(structure.languages),
+                "frameworks": sorted(structure.frameworks),
                 "has_tests": structure.has_tests,
                 "has_docs": structure.has_docs,
                 "has_ci": structure.has_ci,
@@ -124,25 +187,11 @@ async def analyze_project_for_tasks(
                 }
                 for task in existing_tasks
             ],
-            "recommended_tasks": [
-                {
-                    "name": rec.task.full_name,
-                    "domain": rec.task.domain.value,
-                    "description": rec.task.description,
-                    "complexity": rec.task.complexity.value,
-                    "reasoning": rec.reasoning,
-                    "priority": rec.priority,
-                    "estimated_effort": rec.estimated_effort,
-                    "dependencies_needed": rec.dependencies_needed,
-                }
-                for rec in recommendations
-            ],
+            "recommended_tasks": recommended_tasks,
             "summary": {
                 "total_existing": len(existing_tasks),
                 "total_recommended": len(recommendations),
-                "domains_covered": list(
-                    set(rec.task.domain.value for rec in recommendations)
-                ),
+                "domains_covered": sorted(domains_covered),
             },
         }
 
@@ -151,9 +200,10 @@ async def analyze_project_for_tasks(
 
 
 @app.tool()
+@_validated_project_path
 async def trace_task_chain(
-    project_path: str = Field(description="Path to the project directory"),
-    task_name: str = Field(description="Name of the task to trace")
+    project_path: Annotated[str, Field(description="Path to the project directory")],
+    task_name: Annotated[str, Field(description="Name of the task to trace")]
 ) -> Dict[str, Any]:
     """
     Trace the dependency chain for a specific task.
@@ -164,42 +214,45 @@ async def trace_task_chain(
     """
     try:
         project_path_obj = Path(project_path)
-        if not project_path_obj.exists():
-            return {"error": f"Project path {project_path} does not exist"}
 
-        analyzer = TaskAnalyzer(project_path_obj)
+        analyzer = await asyncio.to_thread(_get_analyzer, project_path_obj)
         
         # Use the analyzer's trace_task_chain method
-        result = analyzer.trace_task_chain(task_name)
+        result = await asyncio.to_thread(analyzer.trace_task_chain, task_name)
         
         # If there's an error, return it
         if "error" in result:
-            existing_tasks = analyzer.extract_existing_tasks()
+            existing_tasks = await asyncio.to_thread(analyzer.extract_existing_tasks)
             result["available_tasks"] = [task.full_name for task in existing_tasks]
             return result
         
+        target = result.get("task_name", task_name)
+        execution_order = result.get("execution_order", [])
+        task_details = result.get("task_details", {})
+        in_order: Set[str] = set(execution_order)
+
         # Transform to expected format
         return {
             "project_path": str(project_path_obj),
-            "task_name": result.get("task_name", task_name),  # Keep original field name for compatibility
-            "target_task": result.get("task_name", task_name),
-            "execution_order": result.get("execution_order", []),  # Keep original field for compatibility
+            "task_name": target,  # Keep original field name for compatibility
+            "target_task": target,
+            "execution_order": execution_order,  # Keep original field for compatibility
             "execution_chain": [
                 {
-                    "name": task_name,
+                    "name": name,
                     "domain": details.get("domain", "unknown"),
                     "description": details.get("description", ""),
                     "command": details.get("run", ""),
                     "complexity": details.get("complexity", "simple"),
                 }
-                for task_name, details in result.get("task_details", {}).items()
-                if task_name in result.get("execution_order", [])
+                for name, details in task_details.items()
+                if name in in_order
             ],
             "parallelizable_groups": result.get("parallelizable_groups", []),  # Keep original for compatibility
             "dependencies": result.get("dependencies", []),
             "dependents": result.get("dependents", []),
-            "task_details": result.get("task_details", {}),
-            "total_steps": len(result.get("execution_order", [])),
+            "task_details": task_details,
+            "total_steps": len(execution_order),
             "estimated_complexity": "simple",  # Simple default
         }
 
@@ -208,16 +261,19 @@ async def trace_task_chain(
 
 
 @app.tool()
+@_validated_project_path
 async def create_task(
-    project_path: str = Field(description="Path to the project directory"),
-    task_description: str = Field(description="Description of what the task should do"),
-    suggested_name: Optional[str] = Field(None, description="Suggested task name"),
-    force_complexity: Optional[str] = Field(
-        None, description="Force complexity level (simple/moderate/complex)"
-    ),
-    domain_hint: Optional[str] = Field(
-        None, description="Hint about which domain this task belongs to"
-    )
+    project_path: Annotated[str, Field(description="Path to the project directory")],
+    task_description: Annotated[
+        str, Field(description="Description of what the task should do")
+    ],
+    suggested_name: Annotated[Optional[str], Field(description="Suggested task name")] = None,
+    force_complexity: Annotated[
+        Optional[str], Field(description="Force complexity level (simple/moderate/complex)")
+    ] = None,
+    domain_hint: Annotated[
+        Optional[str], Field(description="Hint about which domain this task belongs to")
+    ] = None
 ) -> Dict[str, Any]:
     """
     Create a new task with intelligent placement and configuration.
@@ -228,35 +284,32 @@ async def create_task(
     """
     try:
         project_path_obj = Path(project_path)
-        if not project_path_obj.exists():
-            return {"error": f"Project path {project_path} does not exist"}
 
-        manager = TaskManager(project_path_obj)
+        manager = await asyncio.to_thread(_get_manager, project_path_obj)
 
         # Parse complexity if provided
         complexity = None
         if force_complexity and isinstance(force_complexity, str):
-            try:
-                complexity = TaskComplexity(force_complexity.lower())
-            except ValueError:
+            complexity = _COMPLEXITY_BY_VALUE.get(force_complexity.lower())
+            if complexity is None:
                 return {
                     "error": f"Invalid complexity '{force_complexity}'. "
-                    f"Must be one of: {[c.value for c in TaskComplexity]}"
+                    f"Must be one of: {list(_COMPLEXITY_BY_VALUE)}"
                 }
 
         # Parse domain hint if provided
         domain = None
         if domain_hint and isinstance(domain_hint, str):
-            try:
-                domain = TaskDomain(domain_hint.lower())
-            except ValueError:
+            domain = _DOMAIN_BY_VALUE.get(domain_hint.lower())
+            if domain is None:
                 return {
                     "error": f"Invalid domain '{domain_hint}'. "
-                    f"Must be one of: {[d.value for d in TaskDomain]}"
+                    f"Must be one of: {list(_DOMAIN_BY_VALUE)}"
                 }
 
-        # Create the task
-        result = manager.create_task_intelligently(
+        # Create the task off the event loop; it reads and rewrites .mise.toml
+        result = await asyncio.to_thread(
+            manager.create_task_intelligently,
             task_description=task_description,
             suggested_name=suggested_name,
             force_complexity=complexity,
@@ -272,8 +325,9 @@ async def create_task(
 
 
 @app.tool()
+@_validated_project_path
 async def validate_task_architecture(
-    project_path: str = Field(description="Path to the project directory")
+    project_path: Annotated[str, Field(description="Path to the project directory")]
 ) -> Dict[str, Any]:
     """
     Validate the current task architecture against best practices.
@@ -284,11 +338,9 @@ async def validate_task_architecture(
     """
     try:
         project_path_obj = Path(project_path)
-        if not project_path_obj.exists():
-            return {"error": f"Project path {project_path} does not exist"}
 
-        analyzer = TaskAnalyzer(project_path_obj)
-        existing_tasks = analyzer.extract_existing_tasks()
+        analyzer = await asyncio.to_thread(_get_analyzer, project_path_obj)
+        existing_tasks = await asyncio.to_thread(analyzer.extract_existing_tasks)
 
         if not existing_tasks:
             return {
@@ -298,7 +350,7 @@ async def validate_task_architecture(
             }
 
         # Validate architecture using the analyzer's method
-        validation_result = analyzer.validate_task_architecture()
+        validation_result = await asyncio.to_thread(analyzer.validate_task_architecture)
 
         return {
             "project_path": str(project_path_obj),
@@ -311,9 +363,12 @@ async def validate_task_architecture(
 
 
 @app.tool()
+@_validated_project_path
 async def prune_tasks(
-    project_path: str = Field(description="Path to the project directory"),
-    dry_run: bool = Field(True, description="Whether to only report what would be pruned")
+    project_path: Annotated[str, Field(description="Path to the project directory")],
+    dry_run: Annotated[
+        bool, Field(description="Whether to only report what would be pruned")
+    ] = True
 ) -> Dict[str, Any]:
     """
     Remove redundant or outdated tasks from the project.
@@ -324,11 +379,9 @@ async def prune_tasks(
     """
     try:
         project_path_obj = Path(project_path)
-        if not project_path_obj.exists():
-            return {"error": f"Project path {project_path} does not exist"}
 
-        analyzer = TaskAnalyzer(project_path_obj)
-        redundant_tasks = analyzer.find_redundant_tasks()
+        analyzer = await asyncio.to_thread(_get_analyzer, project_path_obj)
+        redundant_tasks = await asyncio.to_thread(analyzer.find_redundant_tasks)
 
         if dry_run:
             return {
@@ -346,14 +399,19 @@ async def prune_tasks(
             }
         else:
             # Actually prune the tasks
-            manager = TaskManager(project_path_obj)
-            removed_tasks = []
-            for task_info in redundant_tasks:
-                task_name = task_info.get("task", "")
-                if task_name:
-                    result = manager.remove_task(task_name)
-                    if result.get("success"):
-                        removed_tasks.append(task_info)
+            manager = await asyncio.to_thread(_get_manager, project_path_obj)
+            task_names = await asyncio.to_thread(
+                _config_names, analyzer, [task_info.get("task", "") for task_info in redundant_tasks]
+            )
+            # One batch call, so .mise.toml is rewritten once however many tasks go
+            results = await asyncio.to_thread(
+                manager.remove_tasks, [task_name for task_name in task_names if task_name]
+            )
+            removed_tasks = [
+                task_info
+                for task_info, task_name in zip(redundant_tasks, task_names, strict=True)
+                if task_name and results[task_name].get("success")
+            ]
             
             return {
                 "project_path": str(project_path_obj),
@@ -374,9 +432,10 @@ async def prune_tasks(
 
 
 @app.tool()
+@_validated_project_path
 async def remove_task(
-    project_path: str = Field(description="Path to the project directory"),
-    task_name: str = Field(description="Name of the task to remove")
+    project_path: Annotated[str, Field(description="Path to the project directory")],
+    task_name: Annotated[str, Field(description="Name of the task to remove")]
 ) -> Dict[str, Any]:
     """
     Remove a specific task from the project.
@@ -386,56 +445,74 @@ async def remove_task(
     """
     try:
         project_path_obj = Path(project_path)
-        if not project_path_obj.exists():
-            return {"error": f"Project path {project_path} does not exist"}
-
-        manager = TaskManager(project_path_obj)
-
-        # Check if task exists
-        analyzer = TaskAnalyzer(project_path_obj)
-        existing_tasks = analyzer.extract_existing_tasks()
-
-        target_task = None
-        for task in existing_tasks:
-            if task.full_name == task_name or task.name == task_name:
-                target_task = task
-                break
-
-        if not target_task:
-            return {
-                "error": f"Task '{task_name}' not found",
-                "available_tasks": [task.full_name for task in existing_tasks],
-            }
 
-        # Check for dependent tasks
-        task_graph = analyzer.build_dependency_graph(existing_tasks)
-        dependents = analyzer.find_dependent_tasks(target_task, task_graph)
+        manager = await asyncio.to_thread(_get_manager, project_path_obj)
 
-        # Remove the task
-        result = manager.remove_task(target_task.full_name)
+        # The manager resolves the name and finds dependents from the same parse
+        result = await asyncio.to_thread(manager.remove_task, task_name)
+        if "error" in result:
+            return result
 
         return {
             "project_path": str(project_path_obj),
-            "removed_task": {
-                "name": target_task.full_name,
-                "domain": target_task.domain.value,
-                "description": target_task.description,
-            },
-            "dependent_tasks_affected": [
-                {
-                    "name": task.full_name,
-                    "domain": task.domain.value,
-                }
-                for task in dependents
-            ],
+            "removed_task": result["removed_task"],
+            "dependent_tasks_affected": result["dependents"],
             "warnings": result.get("warnings", []),
-            "success": result.get("success", True),
+            "success": result["success"],
         }
 
     except Exception as e:
         return {"error": f"Task removal failed: {str(e)}"}
 
 
+# The guidance tools return fixed payloads; build each once at import and hand
+# out the same dict, since FastMCP only serializes it
+_TASK_RECOMMENDATIONS = {
+    "best_practices": {
+        "naming": [
+            "Use hierarchical names with domains (build:dev, test:unit)",
+            "Keep names short but descriptive",
+            "Use consistent naming patterns across domains",
+            "Avoid special characters except colons for hierarchy",
+        ],
+        "organization": [
+            "Group related tasks by domain (build, test, lint, deploy)",
+            "Use sub-domains for environment or type (dev/prod, unit/e2e)",
+            "Keep task files organized in .mise/tasks/ directory",
+            "One domain per file when using TOML format",
+        ],
+        "dependencies": [
+            "Declare explicit dependencies rather than implicit ordering",
+            "Avoid circular dependencies",
+            "Use source/output tracking for incremental builds",
+            "Keep dependency chains shallow when possible",
+        ],
+        "performance": [
+            "Use source tracking to avoid unnecessary rebuilds",
+            "Parallelize independent tasks",
+            "Cache expensive operations",
+            "Use outputs to enable incremental workflows",
+        ],
+    },
+    "common_patterns": {
+        "build_pipeline": "lint → test → build → deploy",
+        "development": "install → dev (parallel with test:watch)",
+        "ci_pipeline": "install → lint → test → build → deploy",
+        "release": "test → build → version → publish",
+    },
+    "domain_guidelines": {
+        "build": "Compilation, bundling, asset processing",
+        "test": "Unit, integration, e2e testing",
+        "lint": "Code quality, formatting, static analysis",
+        "deploy": "Deployment, release, publishing",
+        "dev": "Development servers, hot reloading",
+        "db": "Database operations, migrations",
+        "docs": "Documentation generation, serving",
+        "clean": "Cleanup, reset operations",
+    },
+}
+
+
 @app.tool()
 async def get_task_recommendations() -> Dict[str, Any]:
     """
@@ -444,50 +521,67 @@ async def get_task_recommendations() -> Dict[str, Any]:
     This tool provides guidance on how to structure tasks effectively,
     naming conventions, dependency patterns, and optimization strategies.
     """
-    return {
-        "best_practices": {
-            "naming": [
-                "Use hierarchical names with domains (build:dev, test:unit)",
-                "Keep names short but descriptive",
-                "Use consistent naming patterns across domains",
-                "Avoid special characters except colons for hierarchy",
-            ],
-            "organization": [
-                "Group related tasks by domain (build, test, lint, deploy)",
-                "Use sub-domains for environment or type (dev/prod, unit/e2e)",
-                "Keep task files organized in .mise/tasks/ directory",
-                "One domain per file when using TOML format",
-            ],
-            "dependencies": [
-                "Declare explicit dependencies rather than implicit ordering",
-                "Avoid circular dependencies",
-                "Use source/output tracking for incremental builds",
-                "Keep dependency chains shallow when possible",
-            ],
-            "performance": [
-                "Use source tracking to avoid unnecessary rebuilds",
-                "Parallelize independent tasks",
-                "Cache expensive operations",
-                "Use outputs to enable incremental workflows",
-            ],
+    return _TASK_RECOMMENDATIONS
+
+
+_ARCHITECTURE_RULES = {
+    "architecture_principles": {
+        "domain_driven": "Tasks are organized by functional domains (build, test, etc.)",
+        "hierarchical": "Use colon-separated names for sub-domains and environments",
+        "dependency_explicit": "All dependencies should be explicitly declared",
+        "source_aware": "Track source files to enable incremental builds",
+        "output_tracked": "Define outputs for caching and dependency resolution",
+    },
+    "domain_hierarchy": {
+        "build": {
+            "purpose": "Compilation, bundling, asset processing",
+            "sub_domains": ["dev", "prod", "watch", "clean"],
+            "typical_sources": ["src/**/*", "package.json", "tsconfig.json"],
+            "typical_outputs": ["dist/**/*", "build/**/*"],
+        },
+        "test": {
+            "purpose": "All forms of testing",
+            "sub_domains": ["unit", "integration", "e2e", "watch", "coverage"],
+            "typical_sources": ["src/**/*", "test/**/*", "tests/**/*"],
+            "typical_outputs": ["coverage/**/*", "test-results/**/*"],
+        },
+        "lint": {
+            "purpose": "Code quality and formatting",
+            "sub_domains": ["code", "types", "format", "fix"],
+            "typical_sources": ["src/**/*", "test/**/*"],
+            "typical_outputs": ["lint-results.json"],
+        },
+        "deploy": {
+            "purpose": "Deployment and publishing",
+            "sub_domains": ["staging", "prod", "preview"],
+            "typical_sources": ["dist/**/*", "build/**/*"],
+            "typical_outputs": ["deployment-info.json"],
         },
-        "common_patterns": {
-            "build_pipeline": "lint → test → build → deploy",
-            "development": "install → dev (parallel with test:watch)",
-            "ci_pipeline": "install → lint → test → build → deploy",
-            "release": "test → build → version → publish",
+    },
+    "complexity_levels": {
+        "simple": {
+            "description": "Single command, no complex logic",
+            "examples": ["npm run build", "python -m pytest"],
+            "characteristics": ["One-liner", "No conditionals", "Standard tools"],
         },
-        "domain_guidelines": {
-            "build": "Compilation, bundling, asset processing",
-            "test": "Unit, integration, e2e testing",
-            "lint": "Code quality, formatting, static analysis",
-            "deploy": "Deployment, release, publishing",
-            "dev": "Development servers, hot reloading",
-            "db": "Database operations, migrations",
-            "docs": "Documentation generation, serving",
-            "clean": "Cleanup, reset operations",
+        "moderate": {
+            "description": "Multiple steps or conditional logic",
+            "examples": ["Build with environment checks", "Multi-stage testing"],
+            "characteristics": ["2-5 commands", "Some conditionals", "Environment aware"],
         },
-    }
+        "complex": {
+            "description": "Advanced workflows with multiple tools",
+            "examples": ["Full CI/CD pipeline", "Multi-environment deployment"],
+            "characteristics": ["Many steps", "Complex logic", "Multiple tools"],
+        },
+    },
+    "dependency_patterns": {
+        "sequential": "A → B → C (each step depends on the previous)",
+        "parallel": "A + B → C (independent tasks feeding into one)",
+        "fan_out": "A → B + C (one task enabling multiple)",
+        "diamond": "A → B + C → D (parallel middle, converging end)",
+    },
+}
 
 
 @app.tool()
@@ -498,64 +592,71 @@ async def get_mise_architecture_rules() -> Dict[str, Any]:
     This tool explains the design principles, domain organization, and
     architectural decisions that guide intelligent task management.
     """
-    return {
-        "architecture_principles": {
-            "domain_driven": "Tasks are organized by functional domains (build, test, etc.)",
-            "hierarchical": "Use colon-separated names for sub-domains and environments",
-            "dependency_explicit": "All dependencies should be explicitly declared",
-            "source_aware": "Track source files to enable incremental builds",
-            "output_tracked": "Define outputs for caching and dependency resolution",
-        },
-        "domain_hierarchy": {
-            "build": {
-                "purpose": "Compilation, bundling, asset processing",
-                "sub_domains": ["dev", "prod", "watch", "clean"],
-                "typical_sources": ["src/**/*", "package.json", "tsconfig.json"],
-                "typical_outputs": ["dist/**/*", "build/**/*"],
-            },
-            "test": {
-                "purpose": "All forms of testing",
-                "sub_domains": ["unit", "integration", "e2e", "watch", "coverage"],
-                "typical_sources": ["src/**/*", "test/**/*", "tests/**/*"],
-                "typical_outputs": ["coverage/**/*", "test-results/**/*"],
-            },
-            "lint": {
-                "purpose": "Code quality and formatting",
-                "sub_domains": ["code", "types", "format", "fix"],
-                "typical_sources": ["src/**/*", "test/**/*"],
-                "typical_outputs": ["lint-results.json"],
-            },
-            "deploy": {
-                "purpose": "Deployment and publishing",
-                "sub_domains": ["staging", "prod", "preview"],
-                "typical_sources": ["dist/**/*", "build/**/*"],
-                "typical_outputs": ["deployment-info.json"],
-            },
+    return _ARCHITECTURE_RULES
+
+
+_EXPERT_GUIDANCE = {
+    "expert_tips": {
+        "performance_optimization": [
+            "Use source tracking to avoid unnecessary task execution",
+            "Leverage outputs for proper caching and incremental builds",
+            "Parallelize independent tasks with proper dependency declaration",
+            "Use environment-specific tasks (dev vs prod) to optimize workflows",
+            "Consider task granularity - too fine-grained can hurt performance",
+        ],
+        "debugging_tasks": [
+            "Use 'mise tasks ls' to see all available tasks",
+            "Check 'mise tasks deps <task>' to understand dependencies",
+            "Use 'mise run --dry-run <task>' to see what would execute",
+            "Enable verbose output with 'mise run -v <task>' for debugging",
+            "Check source/output tracking with 'mise tasks info <task>'",
+        ],
+        "advanced_patterns": [
+            "Use task templates for repetitive patterns",
+            "Implement conditional tasks based on environment",
+            "Create meta-tasks that orchestrate multiple workflows",
+            "Use file watching for development workflows",
+            "Implement proper cleanup tasks for each domain",
+        ],
+    },
+    "common_issues": {
+        "circular_dependencies": {
+            "problem": "Tasks depend on each other in a loop",
+            "solution": "Refactor to break the cycle, often by extracting common dependencies",
+            "prevention": "Use dependency visualization tools regularly",
         },
-        "complexity_levels": {
-            "simple": {
-                "description": "Single command, no complex logic",
-                "examples": ["npm run build", "python -m pytest"],
-                "characteristics": ["One-liner", "No conditionals", "Standard tools"],
-            },
-            "moderate": {
-                "description": "Multiple steps or conditional logic",
-                "examples": ["Build with environment checks", "Multi-stage testing"],
-                "characteristics": ["2-5 commands", "Some conditionals", "Environment aware"],
-            },
-            "complex": {
-                "description": "Advanced workflows with multiple tools",
-                "examples": ["Full CI/CD pipeline", "Multi-environment deployment"],
-                "characteristics": ["Many steps", "Complex logic", "Multiple tools"],
-            },
+        "slow_builds": {
+            "problem": "Tasks take too long to execute",
+            "solution": "Implement proper source tracking and output caching",
+            "prevention": "Design tasks with incremental builds in mind",
         },
-        "dependency_patterns": {
-            "sequential": "A → B → C (each step depends on the previous)",
-            "parallel": "A + B → C (independent tasks feeding into one)",
-            "fan_out": "A → B + C (one task enabling multiple)",
-            "diamond": "A → B + C → D (parallel middle, converging end)",
+        "missing_dependencies": {
+            "problem": "Tasks fail because prerequisites aren't met",
+            "solution": "Explicitly declare all dependencies",
+            "prevention": "Use validation tools to check architecture",
         },
-    }
+    },
+    "migration_strategies": {
+        "from_npm_scripts": [
+            "Map npm scripts to appropriate mise domains",
+            "Convert package.json scripts to .mise/tasks/ files",
+            "Add proper source/output tracking",
+            "Implement dependency relationships",
+        ],
+        "from_make": [
+            "Convert Makefile targets to mise tasks",
+            "Map make dependencies to mise dependencies",
+            "Use mise's source tracking instead of file timestamps",
+            "Organize by domain rather than alphabetically",
+        ],
+        "from_just": [
+            "Convert justfile recipes to mise tasks",
+            "Maintain recipe organization but add domain structure",
+            "Add source/output tracking for better caching",
+            "Use mise's environment handling",
+        ],
+    },
+}
 
 
 @app.tool()
@@ -566,68 +667,46 @@ async def mise_task_expert_guidance() -> Dict[str, Any]:
     This tool provides advanced tips, troubleshooting advice, and expert
     recommendations for getting the most out of mise task management.
     """
-    return {
-        "expert_tips": {
-            "performance_optimization": [
-                "Use source tracking to avoid unnecessary task execution",
-                "Leverage outputs for proper caching and incremental builds",
-                "Parallelize independent tasks with proper dependency declaration",
-                "Use environment-specific tasks (dev vs prod) to optimize workflows",
-                "Consider task granularity - too fine-grained can hurt performance",
-            ],
-            "debugging_tasks": [
-                "Use 'mise tasks ls' to see all available tasks",
-                "Check 'mise tasks deps <task>' to understand dependencies",
-                "Use 'mise run --dry-run <task>' to see what would execute",
-                "Enable verbose output with 'mise run -v <task>' for debugging",
-                "Check source/output tracking with 'mise tasks info <task>'",
-            ],
-            "advanced_patterns": [
-                "Use task templates for repetitive patterns",
-                "Implement conditional tasks based on environment",
-                "Create meta-tasks that orchestrate multiple workflows",
-                "Use file watching for development workflows",
-                "Implement proper cleanup tasks for each domain",
-            ],
-        },
-        "common_issues": {
-            "circular_dependencies": {
-                "problem": "Tasks depend on each other in a loop",
-                "solution": "Refactor to break the cycle, often by extracting common dependencies",
-                "prevention": "Use dependency visualization tools regularly",
-            },
-            "slow_builds": {
-                "problem": "Tasks take too long to execute",
-                "solution": "Implement proper source tracking and output caching",
-                "prevention": "Design tasks with incremental builds in mind",
-            },
-            "missing_dependencies": {
-                "problem": "Tasks fail because prerequisites aren't met",
-                "solution": "Explicitly declare all dependencies",
-                "prevention": "Use validation tools to check architecture",
-            },
-        },
-        "migration_strategies": {
-            "from_npm_scripts": [
-                "Map npm scripts to appropriate mise domains",
-                "Convert package.json scripts to .mise/tasks/ files",
-                "Add proper source/output tracking",
-                "Implement dependency relationships",
-            ],
-            "from_make": [
-                "Convert Makefile targets to mise tasks",
-                "Map make dependencies to mise dependencies",
-                "Use mise's source tracking instead of file timestamps",
-                "Organize by domain rather than alphabetically",
-            ],
-            "from_just": [
-                "Convert justfile recipes to mise tasks",
-                "Maintain recipe organization but add domain structure",
-                "Add source/output tracking for better caching",
-                "Use mise's environment handling",
-            ],
-        },
-    }
+    return _EXPERT_GUIDANCE
+
+
+_CHAIN_ANALYSIS_GUIDE = {
+    "analysis_techniques": {
+        "critical_path": "Identify the longest chain of dependent tasks",
+        "parallelization": "Find tasks that can run concurrently",
+        "bottleneck_detection": "Locate tasks that block multiple others",
+        "redundancy_analysis": "Find duplicate or unnecessary work",
+    },
+    "optimization_strategies": {
+        "dependency_reduction": [
+            "Remove unnecessary dependencies",
+            "Use outputs instead of implicit dependencies",
+            "Break large tasks into smaller, more focused ones",
+        ],
+        "parallel_execution": [
+            "Identify independent tasks that can run together",
+            "Use proper dependency declaration to enable parallelism",
+            "Consider resource constraints when parallelizing",
+        ],
+        "caching_optimization": [
+            "Implement proper source tracking",
+            "Use outputs for intermediate results",
+            "Cache expensive operations across runs",
+        ],
+    },
+    "performance_metrics": {
+        "execution_time": "Total time from start to finish",
+        "parallel_efficiency": "How well tasks utilize available parallelism",
+        "cache_hit_rate": "Percentage of tasks skipped due to caching",
+        "dependency_depth": "Maximum depth of dependency chains",
+    },
+    "visualization_tips": [
+        "Use dependency graphs to understand task relationships",
+        "Create execution timelines to identify bottlenecks",
+        "Track cache hit rates over time",
+        "Monitor parallel execution efficiency",
+    ],
+}
 
 
 @app.tool()
@@ -638,72 +717,62 @@ async def task_chain_analyst() -> Dict[str, Any]:
     This tool provides insights into task execution patterns, identifies
     bottlenecks, and suggests optimizations for complex task workflows.
     """
-    return {
-        "analysis_techniques": {
-            "critical_path": "Identify the longest chain of dependent tasks",
-            "parallelization": "Find tasks that can run concurrently",
-            "bottleneck_detection": "Locate tasks that block multiple others",
-            "redundancy_analysis": "Find duplicate or unnecessary work",
-        },
-        "optimization_strategies": {
-            "dependency_reduction": [
-                "Remove unnecessary dependencies",
-                "Use outputs instead of implicit dependencies",
-                "Break large tasks into smaller, more focused ones",
-            ],
-            "parallel_execution": [
-                "Identify independent tasks that can run together",
-                "Use proper dependency declaration to enable parallelism",
-                "Consider resource constraints when parallelizing",
-            ],
-            "caching_optimization": [
-                "Implement proper source tracking",
-                "Use outputs for intermediate results",
-                "Cache expensive operations across runs",
-            ],
-        },
-        "performance_metrics": {
-            "execution_time": "Total time from start to finish",
-            "parallel_efficiency": "How well tasks utilize available parallelism",
-            "cache_hit_rate": "Percentage of tasks skipped due to caching",
-            "dependency_depth": "Maximum depth of dependency chains",
-        },
-        "visualization_tips": [
-            "Use dependency graphs to understand task relationships",
-            "Create execution timelines to identify bottlenecks",
-            "Track cache hit rates over time",
-            "Monitor parallel execution efficiency",
-        ],
-    }
+    return _CHAIN_ANALYSIS_GUIDE
+
+
+def _profiling_middleware() -> List["Middleware"]:
+    """HTTP middleware that profiles requests sent with ?profile=1 or an X-Profile header"""
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        print("WISE_MISE_PROFILING is set but pyinstrument is not installed; profiling disabled")
+        return []
+
+    from starlette.middleware import Middleware
+    from starlette.middleware.base import BaseHTTPMiddleware
+    from starlette.responses import HTMLResponse
+
+    async def profile_request(request: "Request", call_next: "RequestResponseEndpoint") -> "Response":
+        if not (request.query_params.get("profile") or request.headers.get("x-profile")):
+            return await call_next(request)
+
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        profiler.start()
+        try:
+            response = await call_next(request)
+            # Tool results may be streamed; the work isn't done until the body is.
+            # call_next is typed as a plain Response, but always returns a streaming one
+            async for _ in response.body_iterator:  # type: ignore[attr-defined]
+                pass
+        finally:
+            profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+    return [Middleware(BaseHTTPMiddleware, dispatch=profile_request)]
 
 
 def main():
     """Main entry point for the MCP server."""
-    import sys
-    import os
-    
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="wise-mise-mcp", description="Wise Mise MCP server")
+    parser.add_argument("--transport", help="Set to 'http' to serve over HTTP instead of stdio")
+    parser.add_argument("--http", action="store_true", help="Shorthand for --transport http")
+    # Kept lenient: a bad or missing value falls back to the default instead of exiting
+    parser.add_argument("--port", nargs="?", const="3000", default="3000")
+    parser.add_argument("--host", nargs="?", const="0.0.0.0", default="0.0.0.0")
+    # MCP clients may pass options meant for other tools; ignore those
+    args, _ = parser.parse_known_args()
+
     # For Docker/HTTP deployment, check if we should use HTTP transport
-    if ('--transport' in sys.argv and 'http' in sys.argv) or '--http' in sys.argv or os.getenv('MCP_TRANSPORT') == 'http':
+    if args.http or args.transport == "http" or os.getenv("MCP_TRANSPORT") == "http":
         # Run with HTTP transport for Docker/web deployment
-        port = 3000
-        host = "0.0.0.0"
-        
-        # Parse port from command line args
+        host = args.host
         try:
-            if '--port' in sys.argv:
-                port_idx = sys.argv.index('--port') + 1
-                port = int(sys.argv[port_idx])
-        except (ValueError, IndexError):
+            port = int(args.port)
+        except ValueError:
             port = 3000
             
-        # Parse host from command line args
-        try:
-            if '--host' in sys.argv:
-                host_idx = sys.argv.index('--host') + 1
-                host = sys.argv[host_idx]
-        except IndexError:
-            host = "0.0.0.0"
-            
         print(f"Starting HTTP MCP server on {host}:{port}")
         
         # Add health check endpoint for Docker - access underlying FastAPI app
@@ -714,7 +783,15 @@ def main():
         except Exception as e:
             print(f"Could not add health endpoint: {e}")
             
-        app.run(transport="http", host=host, port=port, path="/mcp")
+        run_kwargs: Dict[str, Any] = {}
+        if os.getenv("WISE_MISE_PROFILING") == "1":
+            middleware = _profiling_middleware()
+            if middleware:
+                run_kwargs["middleware"] = middleware
+
+        # uvicorn's "auto" loop and parser pick up uvloop and httptools when the
+        # http extra is installed, and fall back to asyncio and h11 otherwise
+        app.run(transport="http", host=host, port=port, path="/mcp", **run_kwargs)
     else:
         # Default to stdio transport
         app.run()